@@ -7,6 +7,9 @@ class Collider(Component):
     """
     碰撞器组件基类，用于碰撞检测。
     """
+    __slots__ = ('is_trigger', 'layer', 'on_collision_enter_callbacks',
+                 'on_collision_exit_callbacks', 'current_collisions')
+
     def __init__(self, gameobject):
         super().__init__(gameobject)
         self.is_trigger = False  # 是否只触发事件而不产生物理碰撞
@@ -58,55 +61,60 @@ class BoxCollider(Collider):
     """
     矩形碰撞器
     """
+    __slots__ = ('width', 'height', 'offset')
+
     def __init__(self, gameobject):
         super().__init__(gameobject)
         self.width = 100
         self.height = 100
         self.offset = pygame.Vector2(0, 0)  # 相对于游戏对象位置的偏移
         
-    def get_rect(self) -> pygame.Rect:
-        """获取碰撞矩形"""
-        transform = self.gameobject.get_component(Transform)
+    def get_aabb(self) -> Tuple[float, float, float, float]:
+        """
+        获取碰撞矩形的AABB (min_x, min_y, max_x, max_y)。
+        热路径只使用浮点元组，不构造pygame.Rect。
+        """
+        transform = self.gameobject.transform
         if transform is None:
-            return pygame.Rect(0, 0, self.width, self.height)
-            
-        world_pos = transform.get_world_position()
-        world_scale = transform.get_world_scale()
-        
-        scaled_width = self.width * world_scale.x
-        scaled_height = self.height * world_scale.y
-        
+            return (0.0, 0.0, float(self.width), float(self.height))
+
+        world_x, world_y = transform._world_xy()
+        scale_x, scale_y = transform._world_scale_xy()
+
+        half_width = self.width * scale_x / 2
+        half_height = self.height * scale_y / 2
+        center_x = world_x + self.offset.x
+        center_y = world_y + self.offset.y
+
         # 考虑旋转的情况下，简化为AABB (Axis-Aligned Bounding Box)
-        return pygame.Rect(
-            world_pos.x + self.offset.x - scaled_width / 2,
-            world_pos.y + self.offset.y - scaled_height / 2,
-            scaled_width,
-            scaled_height
-        )
+        return (center_x - half_width, center_y - half_height,
+                center_x + half_width, center_y + half_height)
+
+    def get_rect(self) -> pygame.Rect:
+        """获取碰撞矩形"""
+        min_x, min_y, max_x, max_y = self.get_aabb()
+        return pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
         
     def is_colliding_with(self, other: 'Collider') -> bool:
         """检测是否与另一个碰撞器碰撞"""
-        if isinstance(other, BoxCollider):
-            return self.get_rect().colliderect(other.get_rect())
-        elif isinstance(other, CircleCollider):
-            return pygame.Rect.collidepoint(self.get_rect(), other.get_center()) or \
-                   self._rect_circle_collision(self.get_rect(), other.get_center(), other.get_radius())
+        # 精确类型比较比isinstance快，isinstance只兜底罕见的子类情况
+        other_type = type(other)
+        if other_type is BoxCollider or isinstance(other, BoxCollider):
+            min_x, min_y, max_x, max_y = self.get_aabb()
+            o_min_x, o_min_y, o_max_x, o_max_y = other.get_aabb()
+            return (min_x <= o_max_x and o_min_x <= max_x and
+                    min_y <= o_max_y and o_min_y <= max_y)
+        elif other_type is CircleCollider or isinstance(other, CircleCollider):
+            # 把圆心钳制到矩形上得到最近点；钳制本身已覆盖圆心在矩形内的情况
+            min_x, min_y, max_x, max_y = self.get_aabb()
+            center_x, center_y = other.get_center()
+            radius = other.get_radius()
+
+            distance_x = center_x - max(min_x, min(center_x, max_x))
+            distance_y = center_y - max(min_y, min(center_y, max_y))
+            return distance_x * distance_x + distance_y * distance_y < radius * radius
         return False
         
-    def _rect_circle_collision(self, rect: pygame.Rect, circle_center: Tuple[float, float], 
-                              circle_radius: float) -> bool:
-        """矩形与圆的碰撞检测"""
-        # 找到矩形上离圆心最近的点
-        closest_x = max(rect.left, min(circle_center[0], rect.right))
-        closest_y = max(rect.top, min(circle_center[1], rect.bottom))
-        
-        # 计算圆心到最近点的距离
-        distance_x = circle_center[0] - closest_x
-        distance_y = circle_center[1] - closest_y
-        
-        # 如果距离小于半径，则发生碰撞
-        return (distance_x ** 2 + distance_y ** 2) < (circle_radius ** 2)
-        
     def to_dict(self) -> Dict[str, Any]:
         """序列化到字典"""
         data = super().to_dict()
@@ -131,6 +139,8 @@ class CircleCollider(Collider):
     """
     圆形碰撞器
     """
+    __slots__ = ('radius', 'offset')
+
     def __init__(self, gameobject):
         super().__init__(gameobject)
         self.radius = 50
@@ -138,35 +148,40 @@ class CircleCollider(Collider):
         
     def get_center(self) -> Tuple[float, float]:
         """获取世界坐标中的圆心位置"""
-        transform = self.gameobject.get_component(Transform)
+        transform = self.gameobject.transform
         if transform is None:
             return (0, 0)
-            
-        world_pos = transform.get_world_position()
-        return (world_pos.x + self.offset.x, world_pos.y + self.offset.y)
+
+        world_x, world_y = transform._world_xy()
+        return (world_x + self.offset.x, world_y + self.offset.y)
         
     def get_radius(self) -> float:
-        """获取世界坐标中的半径"""
-        transform = self.gameobject.get_component(Transform)
+        """
+        获取世界坐标中的半径。
+        非均匀缩放时取x、y缩放中的较大值（保守上界），
+        保证圆完全覆盖缩放后的椭圆足迹，避免漏检。
+        """
+        transform = self.gameobject.transform
         if transform is None:
             return self.radius
-            
-        world_scale = transform.get_world_scale()
-        # 使用x和y缩放的平均值
-        return self.radius * (world_scale.x + world_scale.y) / 2
+
+        scale_x, scale_y = transform._world_scale_xy()
+        return self.radius * (scale_x if scale_x > scale_y else scale_y)
         
     def is_colliding_with(self, other: 'Collider') -> bool:
         """检测是否与另一个碰撞器碰撞"""
-        if isinstance(other, CircleCollider):
+        # 精确类型比较比isinstance快，isinstance只兜底罕见的子类情况
+        other_type = type(other)
+        if other_type is CircleCollider or isinstance(other, CircleCollider):
             # 圆与圆的碰撞
             center1 = self.get_center()
             center2 = other.get_center()
-            
+
             distance_squared = (center1[0] - center2[0]) ** 2 + (center1[1] - center2[1]) ** 2
             combined_radius = self.get_radius() + other.get_radius()
-            
+
             return distance_squared < (combined_radius ** 2)
-        elif isinstance(other, BoxCollider):
+        elif other_type is BoxCollider or isinstance(other, BoxCollider):
             # 圆与矩形的碰撞
             return other.is_colliding_with(self)
         return False
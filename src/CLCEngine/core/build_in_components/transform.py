@@ -8,92 +8,174 @@ class Transform(Component):
     变换组件，处理游戏对象的位置、旋转和缩放。
     每个GameObject默认都会有一个Transform组件。
     """
+    __slots__ = ('position', 'rotation', 'scale', 'z_index',
+                 '_world_position', '_world_rotation', '_world_scale', '_world_cached',
+                 '_world_cache_frame', '_rot_cos', '_rot_sin', '_rot_cache_angle')
+
     def __init__(self, gameobject):
         super().__init__(gameobject)
         self.position = pygame.Vector2(0, 0)
         self.rotation = 0.0  # 角度制，顺时针
         self.scale = pygame.Vector2(1, 1)
         self.z_index = 0  # 用于渲染排序
-        
+
+        # 世界变换缓存，由Scene.update_world_transforms批量计算，
+        # 或在未缓存时由get_world_*按需递归计算
+        self._world_position = pygame.Vector2(0, 0)
+        self._world_rotation = 0.0
+        self._world_scale = pygame.Vector2(1, 1)
+        self._world_cached = False
+        # 缓存所属的帧号，跨帧自动失效，防止绕过setter的直接改动被无限缓存
+        self._world_cache_frame = -1
+
+        # 局部旋转角的cos/sin缓存，按计算时的角度值做键。
+        # rotation是公开属性，允许被直接赋值绕过setter，
+        # 所以不用脏标记而是比对角度，直接赋值也不会拿到过期的方向向量
+        self._rot_cos = 1.0
+        self._rot_sin = 0.0
+        self._rot_cache_angle = 0.0
+
+    def _world_cache_valid(self) -> bool:
+        """世界变换缓存是否有效：未被setter失效且属于当前帧"""
+        return (self._world_cached and
+                self._world_cache_frame == self.gameobject.scene._frame_id)
+
+    def _invalidate_world_cache(self) -> None:
+        """使自身及所有子对象的世界变换缓存失效"""
+        self._world_cached = False
+        for child in self.gameobject.children:
+            child_transform = child.transform
+            if child_transform is not None:
+                child_transform._invalidate_world_cache()
+
     def translate(self, x: float, y: float) -> None:
         """移动物体"""
         self.position.x += x
         self.position.y += y
-        
+        self._invalidate_world_cache()
+
     def set_position(self, x: float, y: float) -> None:
         """设置物体位置"""
         self.position.x = x
         self.position.y = y
-        
+        self._invalidate_world_cache()
+
     def rotate(self, angle: float) -> None:
         """旋转物体（角度制）"""
         self.rotation = (self.rotation + angle) % 360
-        
+        self._invalidate_world_cache()
+
     def set_rotation(self, angle: float) -> None:
         """设置物体旋转角度（角度制）"""
         self.rotation = angle % 360
-        
+        self._invalidate_world_cache()
+
+    def _ensure_trig(self) -> None:
+        """按需刷新局部旋转角的cos/sin缓存，缓存键就是角度本身"""
+        rotation = self.rotation
+        if rotation != self._rot_cache_angle:
+            rad = math.radians(rotation)
+            self._rot_cos = math.cos(rad)
+            self._rot_sin = math.sin(rad)
+            self._rot_cache_angle = rotation
+
     def set_scale(self, x: float, y: float) -> None:
         """设置物体缩放"""
         self.scale.x = x
         self.scale.y = y
+        self._invalidate_world_cache()
         
     def get_forward(self) -> pygame.Vector2:
         """获取前方向向量"""
-        rad = math.radians(self.rotation)
-        return pygame.Vector2(math.cos(rad), math.sin(rad))
-        
+        self._ensure_trig()
+        return pygame.Vector2(self._rot_cos, self._rot_sin)
+
     def get_right(self) -> pygame.Vector2:
         """获取右方向向量"""
-        rad = math.radians(self.rotation + 90)
-        return pygame.Vector2(math.cos(rad), math.sin(rad))
+        # cos(r+90°) = -sin(r)，sin(r+90°) = cos(r)，复用同一组缓存
+        self._ensure_trig()
+        return pygame.Vector2(-self._rot_sin, self._rot_cos)
         
-    def get_world_position(self) -> pygame.Vector2:
-        """获取世界坐标"""
+    def _get_parent_transform(self) -> Optional['Transform']:
+        """获取父对象的Transform，没有父对象或父对象没有Transform时返回None"""
         if self.gameobject.parent is None:
-            return pygame.Vector2(self.position)
-            
-        parent_transform = self.gameobject.parent.get_component(Transform)
+            return None
+        return self.gameobject.parent.transform
+
+    def _resolve_world(self) -> None:
+        """
+        解析世界变换并写入缓存。
+        根对象直接复制局部变换；否则基于父对象的世界变换计算（父对象未缓存时递归解析）。
+        """
+        parent_transform = self._get_parent_transform()
         if parent_transform is None:
-            return pygame.Vector2(self.position)
-            
-        # 考虑父对象的位置、旋转和缩放
-        parent_pos = parent_transform.get_world_position()
-        parent_rot = parent_transform.get_world_rotation()
-        parent_scale = parent_transform.get_world_scale()
-        
+            self._world_position.update(self.position)
+            self._world_rotation = self.rotation
+            self._world_scale.update(self.scale)
+            self._world_cached = True
+            self._world_cache_frame = self.gameobject.scene._frame_id
+            return
+
+        if not parent_transform._world_cache_valid():
+            parent_transform._resolve_world()
+        self._resolve_world_from(parent_transform)
+
+    def _resolve_world_from(self, parent_transform: 'Transform') -> None:
+        """基于已缓存的父世界变换计算自身的世界变换，cos/sin只计算一次"""
+        parent_pos = parent_transform._world_position
+        parent_scale = parent_transform._world_scale
+
+        rad = math.radians(parent_transform._world_rotation)
+        cos_r = math.cos(rad)
+        sin_r = math.sin(rad)
+
         # 旋转和缩放的相对位置
-        rad = math.radians(parent_rot)
-        rot_x = self.position.x * math.cos(rad) - self.position.y * math.sin(rad)
-        rot_y = self.position.x * math.sin(rad) + self.position.y * math.cos(rad)
-        
-        return pygame.Vector2(
+        rot_x = self.position.x * cos_r - self.position.y * sin_r
+        rot_y = self.position.x * sin_r + self.position.y * cos_r
+
+        self._world_position.update(
             parent_pos.x + rot_x * parent_scale.x,
             parent_pos.y + rot_y * parent_scale.y
         )
-        
+        self._world_rotation = (parent_transform._world_rotation + self.rotation) % 360
+        self._world_scale.update(
+            self.scale.x * parent_scale.x,
+            self.scale.y * parent_scale.y
+        )
+        self._world_cached = True
+        self._world_cache_frame = self.gameobject.scene._frame_id
+
+    def _world_xy(self) -> Tuple[float, float]:
+        """获取世界坐标的(x, y)元组，热路径用，不构造Vector2"""
+        if not self._world_cache_valid():
+            self._resolve_world()
+        world_position = self._world_position
+        return (world_position.x, world_position.y)
+
+    def _world_scale_xy(self) -> Tuple[float, float]:
+        """获取世界缩放的(x, y)元组，热路径用，不构造Vector2"""
+        if not self._world_cache_valid():
+            self._resolve_world()
+        world_scale = self._world_scale
+        return (world_scale.x, world_scale.y)
+
+    def get_world_position(self) -> pygame.Vector2:
+        """获取世界坐标"""
+        if not self._world_cache_valid():
+            self._resolve_world()
+        return pygame.Vector2(self._world_position)
+
     def get_world_rotation(self) -> float:
         """获取世界旋转角度"""
-        if self.gameobject.parent is None:
-            return self.rotation
-            
-        parent_transform = self.gameobject.parent.get_component(Transform)
-        if parent_transform is None:
-            return self.rotation
-            
-        return (parent_transform.get_world_rotation() + self.rotation) % 360
-        
+        if not self._world_cache_valid():
+            self._resolve_world()
+        return self._world_rotation
+
     def get_world_scale(self) -> pygame.Vector2:
         """获取世界缩放"""
-        if self.gameobject.parent is None:
-            return pygame.Vector2(self.scale)
-            
-        parent_transform = self.gameobject.parent.get_component(Transform)
-        if parent_transform is None:
-            return pygame.Vector2(self.scale)
-            
-        parent_scale = parent_transform.get_world_scale()
-        return pygame.Vector2(self.scale.x * parent_scale.x, self.scale.y * parent_scale.y)
+        if not self._world_cache_valid():
+            self._resolve_world()
+        return pygame.Vector2(self._world_scale)
         
     def to_dict(self) -> Dict[str, Any]:
         """序列化到字典"""
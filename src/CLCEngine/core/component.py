@@ -8,10 +8,25 @@ class Component:
     组件基类，所有组件都应该继承自这个类。
     组件是附加到游戏对象上的功能单元。
     """
+    __slots__ = ('gameobject', '_enabled')
+
     def __init__(self, gameobject: 'GameObject'):
         self.gameobject = gameobject
-        self.enabled = True
-        
+        self._enabled = True
+
+    @property
+    def enabled(self) -> bool:
+        """组件是否启用"""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if value != self._enabled:
+            self._enabled = value
+            # 启用状态影响场景的扁平组件更新列表
+            self.gameobject.scene._mark_hierarchy_dirty()
+
+
     def start(self) -> None:
         """当组件首次启用时调用"""
         pass
@@ -1,10 +1,11 @@
-import uuid
+import itertools
 from typing import Dict, List, Optional, Type, TypeVar, Any, TYPE_CHECKING
 import pygame
 
 if TYPE_CHECKING:
     from .scene import Scene
     from .component import Component
+    from .build_in_components.transform import Transform
 
 T = TypeVar('T', bound='Component')
 
@@ -13,43 +14,91 @@ class GameObject:
     游戏对象类，是游戏中所有实体的基础。
     游戏对象可以附加多个组件以实现不同的功能。
     """
+    __slots__ = ('id', 'name', 'scene', 'components', '_component_by_type',
+                 'transform', '_active', 'position', 'children', 'parent')
+
+    # 单调递增的整数ID计数器，比uuid4便宜且哈希更快
+    _id_counter = itertools.count(1)
+
     def __init__(self, name: str, scene: 'Scene', position: tuple[float, float] = (0, 0)):
-        self.id = str(uuid.uuid4())
+        self.id = next(GameObject._id_counter)
         self.name = name
         self.scene = scene
         self.components: List['Component'] = []
-        self.active = True
+        # 组件类型索引与Transform直引用，加速get_component热路径
+        self._component_by_type: Dict[type, 'Component'] = {}
+        self.transform: Optional['Transform'] = None
+        self._active = True
         self.position = position
         self.children: List['GameObject'] = []
         self.parent: Optional['GameObject'] = None
-        
+
+    @property
+    def active(self) -> bool:
+        """游戏对象是否激活"""
+        return self._active
+
+    @active.setter
+    def active(self, value: bool) -> None:
+        if value != self._active:
+            self._active = value
+            # 激活状态影响场景的扁平组件更新列表
+            self.scene._mark_hierarchy_dirty()
+
+
     def add_component(self, component_type: Type[T], **kwargs) -> T:
         """添加一个组件到游戏对象"""
         from .component import Component
-        
+        from .build_in_components.transform import Transform
+
         if not issubclass(component_type, Component):
             raise TypeError(f"组件类型必须是Component的子类")
-            
+
         component = component_type(self, **kwargs)
         self.components.append(component)
+        self._component_by_type.setdefault(component_type, component)
+        if self.transform is None and isinstance(component, Transform):
+            self.transform = component
+
+        from .build_in_components.collider import Collider
+        if isinstance(component, Collider):
+            self.scene._register_collider(component)
+
+        self.scene._mark_hierarchy_dirty()
         return component
-        
+
     def get_component(self, component_type: Type[T]) -> Optional[T]:
         """获取指定类型的组件"""
+        # 精确类型命中走O(1)索引，查询基类时退回isinstance扫描
+        component = self._component_by_type.get(component_type)
+        if component is not None:
+            return component
+
         for component in self.components:
             if isinstance(component, component_type):
                 return component
         return None
-        
+
     def get_components(self, component_type: Type[T]) -> List[T]:
         """获取所有指定类型的组件"""
         return [c for c in self.components if isinstance(c, component_type)]
-        
+
     def remove_component(self, component: 'Component') -> None:
         """移除指定的组件"""
         if component in self.components:
             component.on_destroy()
             self.components.remove(component)
+            for key, value in list(self._component_by_type.items()):
+                if value is component:
+                    del self._component_by_type[key]
+            if component is self.transform:
+                self.transform = None
+
+            from .build_in_components.collider import Collider
+            if isinstance(component, Collider):
+                self.scene._unregister_collider(component)
+
+            self.scene._mark_hierarchy_dirty()
             
     def add_child(self, child: 'GameObject') -> None:
         """添加子游戏对象"""
@@ -57,12 +106,14 @@ class GameObject:
             child.parent.children.remove(child)
         child.parent = self
         self.children.append(child)
+        self.scene._mark_hierarchy_dirty()
         
     def remove_child(self, child: 'GameObject') -> None:
         """移除子游戏对象"""
         if child in self.children:
             child.parent = None
             self.children.remove(child)
+            self.scene._mark_hierarchy_dirty()
             
     def start(self) -> None:
         """初始化游戏对象，调用所有组件的start方法"""
@@ -118,7 +169,7 @@ class GameObject:
     def to_dict(self) -> Dict[str, Any]:
         """将游戏对象序列化为字典，用于保存/加载"""
         return {
-            "id": self.id,
+            "id": str(self.id),  # 保存格式中ID仍为字符串
             "name": self.name,
             "active": self.active,
             "position": self.position,
@@ -130,7 +181,6 @@ class GameObject:
     def from_dict(cls, data: Dict[str, Any], scene: 'Scene') -> 'GameObject':
         """从字典中反序列化游戏对象"""
         obj = cls(data["name"], scene, data.get("position", (0, 0)))
-        obj.id = data.get("id", obj.id)
         obj.active = data.get("active", True)
         
         # TODO: 加载组件和子对象
@@ -1,9 +1,18 @@
 from typing import Dict, List, Optional, Type, Any, TypeVar, Callable
+import numpy as np
 import pygame
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    # orjson为可选依赖，未安装时退回标准库json
+    orjson = None
+
 from .gameobject import GameObject
+from .systems.spatial_hash import SpatialHashGrid
+from .systems import collision_kernels
 
 T = TypeVar('T', bound=GameObject)
 
@@ -12,12 +21,48 @@ class Scene:
     场景类，管理游戏中的所有游戏对象。
     一个游戏可以有多个场景，但同一时刻只有一个场景是活跃的。
     """
+    # 碰撞器数量低于该阈值时直接暴力两两检测，空间哈希的维护开销反而更大
+    BROADPHASE_THRESHOLD = 32
+    # 达到该阈值后改用空间哈希；中间规模用X轴排序扫掠（sweep-and-prune）
+    SPATIAL_HASH_THRESHOLD = 256
+
     def __init__(self, name: str, screen_size: tuple[int, int] = (800, 600)):
         self.name = name
-        self.gameobjects: Dict[str, GameObject] = {}  # id -> GameObject
+        self.gameobjects: Dict[int, GameObject] = {}  # id -> GameObject
         self.screen_size = screen_size
         self.background_color = (0, 0, 0)  # 默认黑色背景
         self.is_editor_mode = False
+        # 帧号，update时递增；世界变换缓存按帧号自动失效
+        self._frame_id = 0
+        self._spatial_hash = SpatialHashGrid()
+
+        # 场景持有的碰撞器注册表，add_component/remove_component时维护，
+        # 碰撞检测不再逐对象逐组件扫描
+        self._colliders: List[Any] = []
+
+        # 根对象缓存，成员变化时重建，避免每帧扫描gameobjects字典
+        self._roots: List[GameObject] = []
+        self._roots_dirty = True
+
+        # 父级在前的Transform拓扑序列，层级变化时重建
+        self._transform_order: List[Any] = []
+        self._transform_order_dirty = True
+
+        # 扁平的启用组件更新列表，按层级顺序排列，结构变化时重建
+        self._update_components: List[Any] = []
+        self._fixed_update_components: List[Any] = []
+        self._components_dirty = True
+
+        # 碰撞器AABB的SoA数组缓存（结构数组，按注册顺序索引）
+        self._collider_index: Dict[int, int] = {}  # id(collider) -> 数组下标
+        self._aabb_mins = np.empty((0, 2), dtype=np.float64)
+        self._aabb_maxs = np.empty((0, 2), dtype=np.float64)
+        self._collider_centers = np.empty((0, 2), dtype=np.float64)
+        self._collider_radii = np.empty(0, dtype=np.float64)
+        self._collider_kinds = np.empty(0, dtype=np.int8)
+
+        # 上一帧仍在碰撞中的碰撞对，key为排序后的(id, id)
+        self._active_collisions: Dict[tuple[int, int], tuple[Any, Any]] = {}
         
     def create_gameobject(self, name: str, position: tuple[float, float] = (0, 0)) -> GameObject:
         """创建一个新的游戏对象并添加到场景中"""
@@ -28,13 +73,41 @@ class Scene:
     def add_gameobject(self, gameobject: GameObject) -> None:
         """添加一个游戏对象到场景中"""
         self.gameobjects[gameobject.id] = gameobject
-        
+        # 根对象缓存和扁平组件列表都依赖成员集合，必须全部失效
+        self._mark_hierarchy_dirty()
+
     def remove_gameobject(self, gameobject: GameObject) -> None:
         """从场景中移除一个游戏对象"""
         if gameobject.id in self.gameobjects:
             del self.gameobjects[gameobject.id]
+            if self._colliders:
+                self._colliders = [c for c in self._colliders
+                                   if c.gameobject is not gameobject]
+            self._mark_hierarchy_dirty()
+
+    def _register_collider(self, collider: Any) -> None:
+        """将碰撞器加入场景注册表"""
+        self._colliders.append(collider)
+
+    def _unregister_collider(self, collider: Any) -> None:
+        """从场景注册表中移除碰撞器"""
+        if collider in self._colliders:
+            self._colliders.remove(collider)
+
+    def _mark_hierarchy_dirty(self) -> None:
+        """标记对象层级已变化，下次更新时重建Transform拓扑序列和组件更新列表"""
+        self._roots_dirty = True
+        self._transform_order_dirty = True
+        self._components_dirty = True
+
+    def _get_roots(self) -> List[GameObject]:
+        """获取根对象列表，仅在成员变化后重建"""
+        if self._roots_dirty:
+            self._roots = [obj for obj in self.gameobjects.values() if obj.parent is None]
+            self._roots_dirty = False
+        return self._roots
             
-    def get_gameobject_by_id(self, gameobject_id: str) -> Optional[GameObject]:
+    def get_gameobject_by_id(self, gameobject_id: int) -> Optional[GameObject]:
         """通过ID获取游戏对象"""
         return self.gameobjects.get(gameobject_id)
         
@@ -53,46 +126,267 @@ class Scene:
         
     def start(self) -> None:
         """初始化场景中的所有游戏对象"""
-        for gameobject in list(self.gameobjects.values()):
+        for gameobject in list(self._get_roots()):
             if gameobject.active:
                 gameobject.start()
                 
+    def _rebuild_component_lists(self) -> None:
+        """
+        重建扁平的组件更新列表。
+        按层级顺序收集激活对象上启用的组件，未重写update/fixed_update的
+        组件不进入对应列表，热循环中不再做active/enabled分支判断。
+        """
+        from .component import Component
+
+        update_list = []
+        fixed_update_list = []
+        stack = list(self._get_roots())
+        while stack:
+            gameobject = stack.pop()
+            if not gameobject.active:
+                continue
+            for component in gameobject.components:
+                if not component.enabled:
+                    continue
+                cls = type(component)
+                if cls.update is not Component.update:
+                    update_list.append(component)
+                if cls.fixed_update is not Component.fixed_update:
+                    fixed_update_list.append(component)
+            stack.extend(gameobject.children)
+
+        self._update_components = update_list
+        self._fixed_update_components = fixed_update_list
+        self._components_dirty = False
+
     def update(self, delta_time: float) -> None:
         """更新场景中的所有游戏对象"""
-        for gameobject in list(self.gameobjects.values()):
-            if gameobject.active:
-                gameobject.update(delta_time)
-                
+        self._frame_id += 1
+        if self._components_dirty:
+            self._rebuild_component_lists()
+        for component in self._update_components:
+            component.update(delta_time)
+
+        self.update_world_transforms()
+
     def fixed_update(self, fixed_delta_time: float) -> None:
         """以固定时间间隔更新场景中的所有游戏对象"""
-        for gameobject in list(self.gameobjects.values()):
-            if gameobject.active:
-                gameobject.fixed_update(fixed_delta_time)
-                
-    def render(self, screen: pygame.Surface) -> None:
-        """渲染场景"""
+        if self._components_dirty:
+            self._rebuild_component_lists()
+        for component in self._fixed_update_components:
+            component.fixed_update(fixed_delta_time)
+
+        self.update_world_transforms()
+        self._update_collisions()
+
+    def _rebuild_transform_order(self) -> None:
+        """按父级在前的顺序重建Transform拓扑序列"""
+        from .build_in_components.transform import Transform
+
+        order = []
+        stack = list(self._get_roots())
+        while stack:
+            gameobject = stack.pop()
+            transform = gameobject.get_component(Transform)
+            if transform is not None:
+                order.append(transform)
+            stack.extend(gameobject.children)
+
+        self._transform_order = order
+        self._transform_order_dirty = False
+
+    def update_world_transforms(self) -> None:
+        """
+        批量解析所有Transform的世界变换。
+        按拓扑序parent-first单次扫描，每个Transform的世界变换只计算一次，
+        替代get_world_*逐次递归父链的方式。
+        """
+        if self._transform_order_dirty:
+            self._rebuild_transform_order()
+
+        for transform in self._transform_order:
+            parent_transform = transform._get_parent_transform()
+            if parent_transform is None:
+                transform._world_position.update(transform.position)
+                transform._world_rotation = transform.rotation
+                transform._world_scale.update(transform.scale)
+                transform._world_cached = True
+                transform._world_cache_frame = self._frame_id
+            else:
+                # 拓扑序保证父级已先解析
+                transform._resolve_world_from(parent_transform)
+
+    def _collect_colliders(self) -> List[Any]:
+        """从注册表中筛选激活对象上启用的碰撞器"""
+        return [c for c in self._colliders
+                if c.enabled and c.gameobject.active]
+
+    def _rebuild_collider_arrays(self) -> List[Any]:
+        """
+        重建碰撞器AABB的SoA数组。
+        先收集每个碰撞器的世界坐标中心和半宽高，再用NumPy一次性算出所有AABB，
+        避免在粗检测阶段逐对象做Python级别的矩形运算。
+        """
+        from .build_in_components.collider import CircleCollider
+
+        colliders = self._collect_colliders()
+        count = len(colliders)
+
+        centers = np.empty((count, 2), dtype=np.float64)
+        half_extents = np.empty((count, 2), dtype=np.float64)
+        radii = np.zeros(count, dtype=np.float64)
+        kinds = np.empty(count, dtype=np.int8)
+        self._collider_index = {}
+
+        for i, collider in enumerate(colliders):
+            self._collider_index[id(collider)] = i
+            if isinstance(collider, CircleCollider):
+                centers[i] = collider.get_center()
+                radius = collider.get_radius()
+                half_extents[i] = (radius, radius)
+                radii[i] = radius
+                kinds[i] = collision_kernels.KIND_CIRCLE
+            else:
+                # 直接取浮点AABB，避免构造pygame.Rect（及其整型截断）
+                min_x, min_y, max_x, max_y = collider.get_aabb()
+                centers[i] = ((min_x + max_x) / 2, (min_y + max_y) / 2)
+                half_extents[i] = ((max_x - min_x) / 2, (max_y - min_y) / 2)
+                kinds[i] = collision_kernels.KIND_BOX
+
+        # 一次向量化计算所有AABB
+        self._aabb_mins = centers - half_extents
+        self._aabb_maxs = centers + half_extents
+        self._collider_centers = centers
+        self._collider_radii = radii
+        self._collider_kinds = kinds
+        return colliders
+
+    def get_aabbs(self) -> tuple[np.ndarray, np.ndarray]:
+        """获取当前缓存的碰撞器AABB数组，形状均为(N, 2)"""
+        return self._aabb_mins, self._aabb_maxs
+
+    def _sweep_and_prune(self, colliders: List[Any]) -> List[tuple[Any, Any]]:
+        """
+        X轴排序扫掠粗检测：按min_x排序后线性扫掠，
+        维护一个按max_x淘汰的活动列表，Y轴也重叠的才作为候选对。
+        """
+        mins, maxs = self._aabb_mins, self._aabb_maxs
+        # 帧间连贯性下数组接近有序，稳定排序（timsort）接近线性
+        order = np.argsort(mins[:, 0], kind='stable')
+
+        pairs = []
+        active: List[int] = []
+        for i in order:
+            min_x = mins[i, 0]
+            active = [j for j in active if maxs[j, 0] >= min_x]
+            for j in active:
+                if mins[i, 1] <= maxs[j, 1] and mins[j, 1] <= maxs[i, 1]:
+                    pairs.append((colliders[i], colliders[j]))
+            active.append(i)
+        return pairs
+
+    def get_collision_pairs(self) -> List[tuple[Any, Any]]:
+        """
+        生成候选碰撞对。
+        按碰撞器数量分三档：小规模向量化两两过滤，
+        中等规模X轴排序扫掠，大规模空间哈希。
+        """
+        colliders = self._rebuild_collider_arrays()
+        count = len(colliders)
+        mins, maxs = self._aabb_mins, self._aabb_maxs
+
+        if count < self.BROADPHASE_THRESHOLD:
+            # 向量化的两两AABB相交测试：overlap[i, j] 为i、j的AABB是否重叠
+            overlap = np.all(
+                (mins[:, None, :] <= maxs[None, :, :]) &
+                (maxs[:, None, :] >= mins[None, :, :]),
+                axis=2
+            )
+            i_idx, j_idx = np.nonzero(np.triu(overlap, k=1))
+            return [(colliders[i], colliders[j]) for i, j in zip(i_idx, j_idx)]
+
+        if count < self.SPATIAL_HASH_THRESHOLD:
+            return self._sweep_and_prune(colliders)
+
+        self._spatial_hash.clear()
+        for i, collider in enumerate(colliders):
+            self._spatial_hash.insert(
+                collider, (mins[i, 0], mins[i, 1], maxs[i, 0], maxs[i, 1]))
+        return list(self._spatial_hash.query_pairs())
+
+    def _update_collisions(self) -> None:
+        """碰撞检测与进入/退出事件分发"""
+        pairs = self.get_collision_pairs()
+
+        # 窄检测走编译核心（numba可用时JIT），is_colliding_with保留给用户代码
+        index = self._collider_index
+        i_idx = np.fromiter((index[id(a)] for a, _ in pairs), dtype=np.int64, count=len(pairs))
+        j_idx = np.fromiter((index[id(b)] for _, b in pairs), dtype=np.int64, count=len(pairs))
+        hits = np.empty(len(pairs), dtype=np.bool_)
+        collision_kernels.narrow_phase(
+            i_idx, j_idx, self._aabb_mins, self._aabb_maxs,
+            self._collider_centers, self._collider_radii, self._collider_kinds, hits)
+
+        # 与上一帧的碰撞对集合做差分，补发粗检测不再产生的碰撞对的退出事件
+        colliding_pairs: Dict[tuple[int, int], tuple[Any, Any]] = {}
+        for (a, b), colliding in zip(pairs, hits):
+            if colliding:
+                key = (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+                colliding_pairs[key] = (a, b)
+
+        for key, (a, b) in colliding_pairs.items():
+            if key not in self._active_collisions:
+                a.current_collisions.append(b)
+                b.current_collisions.append(a)
+                a.on_collision_enter(b)
+                b.on_collision_enter(a)
+
+        for key, (a, b) in self._active_collisions.items():
+            if key not in colliding_pairs:
+                if b in a.current_collisions:
+                    a.current_collisions.remove(b)
+                if a in b.current_collisions:
+                    b.current_collisions.remove(a)
+                a.on_collision_exit(b)
+                b.on_collision_exit(a)
+
+        self._active_collisions = colliding_pairs
+
+    def render(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """渲染场景，返回本帧实际修改的屏幕区域（脏矩形）列表"""
         # 清空屏幕，使用背景色
         screen.fill(self.background_color)
-        
-        # TODO: 实现渲染逻辑，按Z轴排序等
-        
+
+        # TODO: 实现渲染逻辑，按Z轴排序等。真正的渲染器应只重绘
+        # 发生变化的对象并上报对应区域，而不是整屏记脏
+        return [screen.get_rect()]
+
+
     def save(self, filepath: str) -> None:
-        """将场景保存到文件"""
+        """将场景保存到文件。编辑器模式下输出缩进格式，否则输出紧凑格式"""
         data = {
             "name": self.name,
             "screen_size": self.screen_size,
             "background_color": self.background_color,
-            "gameobjects": [obj.to_dict() for obj in self.gameobjects.values() if obj.parent is None]
+            "gameobjects": [obj.to_dict() for obj in self._get_roots()]
         }
-        
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-            
+
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if self.is_editor_mode:
+                option |= orjson.OPT_INDENT_2
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2 if self.is_editor_mode else None)
+
     @classmethod
     def load(cls, filepath: str) -> 'Scene':
         """从文件加载场景"""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
         scene = cls(data["name"], data.get("screen_size", (800, 600)))
         scene.background_color = data.get("background_color", (0, 0, 0))
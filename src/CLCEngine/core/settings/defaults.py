@@ -8,25 +8,11 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any, Tuple, List
 from pathlib import Path
 
-def find_clc_engine_path(start_dir: Path = Path(__file__).resolve()):
-    """
-    从当前文件所在路径开始，一直向上查找父路径，
-    直到找到文件夹名为 "CLC Engine"。
-    """
-    for parent in [start_dir] + list(start_dir.parents):
-        if parent.name == "CLC Engine":
-            return parent
-    raise FileNotFoundError("无法找到名为 'CLC Engine' 的文件夹。")
+# 包路径在导入时解析一次：defaults.py位于 <SRC_CLC_PATH>/core/settings/ 之下。
+# 不再向上遍历查找名为 "CLC Engine" 的目录，也不在导入时改动sys.path。
+SRC_CLC_PATH = str(Path(__file__).resolve().parents[2])
+
 
-try:
-    BASE_PATH = find_clc_engine_path()
-    SRC_CLC_PATH = os.path.join(BASE_PATH, "src", "CLCEngine")
-    import sys
-    if SRC_CLC_PATH not in sys.path:
-        sys.path.append(SRC_CLC_PATH)
-except FileNotFoundError:
-    exit("无法找到名为 'CLC Engine' 的文件夹。请确保脚本在正确的目录中运行。")
-    
 @dataclass
 class DefaultSettings:
     """
@@ -0,0 +1,58 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba为可选依赖，未安装时退回纯Python实现
+    njit = None
+
+# 碰撞器形状类型编码，与Scene的SoA数组配合使用
+KIND_BOX = 0
+KIND_CIRCLE = 1
+
+def _narrow_phase_impl(i_idx, j_idx, mins, maxs, centers, radii, kinds, out_hits):
+    """
+    窄检测核心：对候选碰撞对逐对判定是否真正相交
+
+    Args:
+        i_idx, j_idx: 候选对在SoA数组中的下标，形状(P,)
+        mins, maxs: AABB角点数组，形状(N, 2)
+        centers: 碰撞器中心数组，形状(N, 2)
+        radii: 圆形碰撞器半径数组，形状(N,)
+        kinds: 形状类型数组（KIND_BOX / KIND_CIRCLE），形状(N,)
+        out_hits: 输出的bool数组，形状(P,)
+    """
+    for p in range(i_idx.shape[0]):
+        i = i_idx[p]
+        j = j_idx[p]
+        ki = kinds[i]
+        kj = kinds[j]
+
+        if ki == KIND_BOX and kj == KIND_BOX:
+            # 矩形与矩形：AABB相交测试。
+            # 用按位&代替and，四个比较不做短路分支，避免随机场景下的分支预测失败
+            out_hits[p] = ((mins[i, 0] <= maxs[j, 0]) & (mins[j, 0] <= maxs[i, 0]) &
+                           (mins[i, 1] <= maxs[j, 1]) & (mins[j, 1] <= maxs[i, 1]))
+        elif ki == KIND_CIRCLE and kj == KIND_CIRCLE:
+            # 圆与圆：圆心距离平方与半径和平方比较
+            dx = centers[i, 0] - centers[j, 0]
+            dy = centers[i, 1] - centers[j, 1]
+            combined = radii[i] + radii[j]
+            out_hits[p] = dx * dx + dy * dy < combined * combined
+        else:
+            # 矩形与圆：找到矩形上离圆心最近的点
+            if ki == KIND_CIRCLE:
+                box, circle = j, i
+            else:
+                box, circle = i, j
+
+            closest_x = min(max(centers[circle, 0], mins[box, 0]), maxs[box, 0])
+            closest_y = min(max(centers[circle, 1], mins[box, 1]), maxs[box, 1])
+            dx = centers[circle, 0] - closest_x
+            dy = centers[circle, 1] - closest_y
+            out_hits[p] = dx * dx + dy * dy < radii[circle] * radii[circle]
+
+if njit is not None:
+    narrow_phase = njit(cache=True, fastmath=True)(_narrow_phase_impl)
+else:
+    narrow_phase = _narrow_phase_impl
@@ -8,24 +8,38 @@ class EventArgs:
     """
     事件参数基类，所有事件数据都应继承自这个类
     """
-    pass
+    # 空slots让子类可以自由选择slots布局；不声明slots的子类仍有__dict__
+    __slots__ = ()
 
 class EventHandler:
     """
     事件处理器，类似C#中的delegate
     """
     def __init__(self):
-        self._callbacks: Set[Callable] = set()
-        
+        # callback -> 统一为(sender, args)签名的调用桩，订阅时按参数个数生成一次
+        self._callbacks: Dict[Callable, Callable] = {}
+        # 调用桩的不可变快照，invoke直接迭代它，省去每次的list()拷贝；
+        # 订阅/退订时重建，回调中途增删处理函数依然安全
+        self._thunks: tuple = ()
+
     def __iadd__(self, callback: Callable) -> 'EventHandler':
         """
         使用 += 运算符添加事件处理函数
-        
+
         例如: some_event += handler_function
         """
         if not callable(callback):
             raise TypeError("事件处理器必须是可调用对象")
-        self._callbacks.add(callback)
+        if callback not in self._callbacks:
+            param_count = len(inspect.signature(callback).parameters)
+            if param_count == 0:
+                thunk = lambda sender, args, _cb=callback: _cb()
+            elif param_count == 1:
+                thunk = lambda sender, args, _cb=callback: _cb(sender)
+            else:
+                thunk = callback
+            self._callbacks[callback] = thunk
+            self._thunks = tuple(self._callbacks.values())
         return self
         
     def __isub__(self, callback: Callable) -> 'EventHandler':
@@ -35,7 +49,8 @@ class EventHandler:
         例如: some_event -= handler_function
         """
         if callback in self._callbacks:
-            self._callbacks.remove(callback)
+            del self._callbacks[callback]
+            self._thunks = tuple(self._callbacks.values())
         return self
         
     def invoke(self, sender: Any, args: EventArgs = None) -> None:
@@ -46,23 +61,9 @@ class EventHandler:
             sender: 事件发送者
             args: 事件参数
         """
-        if not self._callbacks:
-            return
-            
-        # 创建要调用的处理函数的副本，以便在回调过程中可以安全地添加或删除处理函数
-        callbacks = self._callbacks.copy()
-        
-        for callback in callbacks:
-            # 检查回调函数的参数数量，以支持不同签名的回调
-            sig = inspect.signature(callback)
-            param_count = len(sig.parameters)
-            
-            if param_count == 0:
-                callback()
-            elif param_count == 1:
-                callback(sender)
-            else:
-                callback(sender, args)
+        # 迭代的是订阅时固化的快照元组，回调中增删处理函数不影响本轮分发
+        for thunk in self._thunks:
+            thunk(sender, args)
                 
     def has_subscribers(self) -> bool:
         """
@@ -78,6 +79,7 @@ class EventHandler:
         清除所有事件处理函数
         """
         self._callbacks.clear()
+        self._thunks = ()
 
 class Event(Generic[T]):
     """
@@ -86,6 +88,8 @@ class Event(Generic[T]):
     def __init__(self, name: str = ""):
         self.name = name
         self._handler = EventHandler()
+        # 实例属性直通处理器的invoke，触发时少走一层Event.invoke包装
+        self.invoke = self._handler.invoke
         
     def __iadd__(self, callback: Callable) -> 'Event[T]':
         """
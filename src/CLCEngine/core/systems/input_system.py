@@ -1,9 +1,89 @@
+import time
+
+import numpy as np
 import pygame
 from typing import Dict, Set, Tuple, Optional, List, Callable
 
+# numba是可选依赖：装了就JIT轴求值内核，没装走numpy/标量路径
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# 键盘位图参数。pygame的可打印键码小于256；带SDLK_SCANCODE_MASK(1<<30)的
+# 功能键折叠为 256+scancode（SDL scancode < 512），总共1024位=128字节。
+_SCANCODE_MASK = 1 << 30
+_KEY_BITMAP_BYTES = 128
+_KEY_BITMAP_ZERO = bytes(_KEY_BITMAP_BYTES)
+_MOUSE_BITMAP_BYTES = 8
+_MOUSE_BITMAP_ZERO = bytes(_MOUSE_BITMAP_BYTES)
+
+
+def _key_index(key: int) -> int:
+    """把pygame键码折叠到位图索引（0..1023）"""
+    if key & _SCANCODE_MASK:
+        return 256 + (key & 0x1FF)
+    return key & 0xFF
+
+
+def _bit_test(bitmap, index: int) -> bool:
+    """测试位"""
+    return bool(bitmap[index >> 3] & (1 << (index & 7)))
+
+
+def _axis_kernel_impl(bitmap, pos, neg, sens):
+    """轴求值内核：直接在位图上取正负键的位，乘灵敏度累加并钳制"""
+    value = 0.0
+    for i in range(pos.size):
+        p = pos[i]
+        n = neg[i]
+        value += sens[i] * (
+            ((bitmap[p >> 3] >> (p & 7)) & 1) - ((bitmap[n >> 3] >> (n & 7)) & 1)
+        )
+    if value < -1.0:
+        return -1.0
+    if value > 1.0:
+        return 1.0
+    return value
+
+
+_axis_kernel = njit(cache=True)(_axis_kernel_impl) if njit is not None else None
+
+
+def _make_key_probe(bitmap: bytearray) -> Callable[[int], bool]:
+    """
+    生成绑定到具体键盘位图的查询闭包。位图和掩码通过默认参数绑定为局部
+    变量，每帧每实体的高频查询只付一次C级调用，不走方法分发。
+    """
+    def probe(key: int, _bm=bitmap, _mask=_SCANCODE_MASK) -> bool:
+        index = (256 + (key & 0x1FF)) if key & _mask else key & 0xFF
+        return bool(_bm[index >> 3] & (1 << (index & 7)))
+    return probe
+
+
+class _InputCallbacks:
+    """
+    回调注册表，与热路径的按键状态分离存放。
+    多数只做轮询的游戏从不注册回调，此时InputSystem._callbacks保持None，
+    事件处理里只付一次None比较。
+    """
+    __slots__ = ('key_down', 'key_up', 'mouse_down', 'mouse_up')
+
+    def __init__(self):
+        self.key_down: Dict[int, Tuple[Callable[[], None], ...]] = {}
+        self.key_up: Dict[int, Tuple[Callable[[], None], ...]] = {}
+        self.mouse_down: Dict[int, Tuple[Callable[[Tuple[int, int]], None], ...]] = {}
+        self.mouse_up: Dict[int, Tuple[Callable[[Tuple[int, int]], None], ...]] = {}
+
+
 class InputSystem:
     """
-    输入系统，管理键盘、鼠标和控制器的输入
+    输入系统，管理键盘、鼠标和控制器的输入。
+
+    调用顺序约定：输入必须在每帧最开始采集，否则本帧逻辑读到的是
+    上一帧的输入，凭空多出一帧延迟。推荐顺序：
+
+        input_system.poll_and_tick() -> time_system.update() -> 逻辑更新 -> 渲染
     """
     _instance: Optional['InputSystem'] = None
     
@@ -15,121 +95,253 @@ class InputSystem:
     
     def _init_singleton(self):
         """初始化单例"""
-        self.keys_pressed: Set[int] = set()  # 当前按下的键
-        self.keys_down: Set[int] = set()  # 这一帧新按下的键
-        self.keys_up: Set[int] = set()  # 这一帧释放的键
-        
+        # 按键状态用定长位图而不是set：成员测试是一次字节读取加位运算，
+        # 每帧清空是一次切片赋值（C层memcpy），没有哈希开销
+        self.keys_pressed = bytearray(_KEY_BITMAP_BYTES)  # 当前按下的键
+        self.keys_down = bytearray(_KEY_BITMAP_BYTES)  # 这一帧新按下的键
+        self.keys_up = bytearray(_KEY_BITMAP_BYTES)  # 这一帧释放的键
+
+        # 高频查询的快捷入口：input.pressed(key)等价于is_key_pressed(key)，
+        # 但闭包里全是局部变量访问。位图只做原地清零，绑定始终有效
+        self.pressed = _make_key_probe(self.keys_pressed)
+        self.down = _make_key_probe(self.keys_down)
+        self.up = _make_key_probe(self.keys_up)
+
         self.mouse_position = (0, 0)
         self.mouse_delta = (0, 0)
-        self.mouse_buttons_pressed: Set[int] = set()  # 当前按下的鼠标按钮
-        self.mouse_buttons_down: Set[int] = set()  # 这一帧新按下的鼠标按钮
-        self.mouse_buttons_up: Set[int] = set()  # 这一帧释放的鼠标按钮
+        self.mouse_buttons_pressed = bytearray(_MOUSE_BITMAP_BYTES)  # 当前按下的鼠标按钮
+        self.mouse_buttons_down = bytearray(_MOUSE_BITMAP_BYTES)  # 这一帧新按下的鼠标按钮
+        self.mouse_buttons_up = bytearray(_MOUSE_BITMAP_BYTES)  # 这一帧释放的鼠标按钮
         self.mouse_wheel_delta = 0
         
-        self.on_key_down_callbacks: Dict[int, List[Callable[[], None]]] = {}
-        self.on_key_up_callbacks: Dict[int, List[Callable[[], None]]] = {}
-        self.on_mouse_down_callbacks: Dict[int, List[Callable[[Tuple[int, int]], None]]] = {}
-        self.on_mouse_up_callbacks: Dict[int, List[Callable[[Tuple[int, int]], None]]] = {}
+        # 回调注册表延迟创建，见_InputCallbacks
+        self._callbacks: Optional[_InputCallbacks] = None
         
         self.axis_mappings: Dict[str, List[Tuple[int, int, float]]] = {}  # 轴映射，键->值
-        
-    def update(self, events: Optional[List[pygame.event.Event]] = None) -> None:
-        """更新输入状态，每帧调用"""
-        # 清除上一帧的状态
-        self.keys_down.clear()
-        self.keys_up.clear()
-        self.mouse_buttons_down.clear()
-        self.mouse_buttons_up.clear()
+        # 每个轴编译出的(正向位图索引, 负向位图索引, 灵敏度)并行数组，
+        # 映射较多时get_axis走向量化路径
+        self._axis_compiled: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+        # 上一帧是否写入过瞬时状态（keys_down等位图非零）；
+        # 空闲帧据此跳过四次位图清零
+        self._transient_active = False
+
+        # 事件泵的节流：防的是同一帧内多处调用poll_and_tick反复进内核，
+        # 所以间隔取目标帧周期的一半——Clock.tick的毫秒级休眠经常让相邻
+        # 两帧略短于整帧周期，用整帧做间隔会把当帧唯一的一次pump也跳掉，
+        # 输入、QUIT、UI点击全部迟到一帧
+        self._last_pump_time = 0.0
+        self._pump_interval = 0.5 / 60.0
+
+        # 输入系统关心的事件类型。无参update只取这些类型，
+        # 其它事件留在SDL队列里，不为它们构造Python对象
+        self._handled_types = [
+            pygame.KEYDOWN, pygame.KEYUP,
+            pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+            pygame.QUIT,
+        ]
+
+        # 事件类型 -> 处理方法的分发表，代替每事件走一遍if/elif链
+        self._event_dispatch = {
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.KEYUP: self._on_key_up,
+            pygame.MOUSEMOTION: self._on_mouse_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button_up,
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+        }
+
+    def update(self, events: List[pygame.event.Event]) -> None:
+        """
+        更新输入状态，每帧调用。
+        事件由调用方负责取出（通常经poll_and_tick或wait_update），
+        本方法自身不再pump事件队列，所有轮询决策集中在一处。
+        """
+        # 空闲快路径：没有新事件且上一帧没写过瞬时位图时，位图已经全零，
+        # 只需重置两个标量
+        if not events and not self._transient_active:
+            self.mouse_wheel_delta = 0
+            self.mouse_delta = (0, 0)
+            return
+
+        # 清除上一帧的状态（切片赋值等价于memset）
+        self.keys_down[:] = _KEY_BITMAP_ZERO
+        self.keys_up[:] = _KEY_BITMAP_ZERO
+        self.mouse_buttons_down[:] = _MOUSE_BITMAP_ZERO
+        self.mouse_buttons_up[:] = _MOUSE_BITMAP_ZERO
         self.mouse_wheel_delta = 0
-        
-        # 处理事件
-        for event in events or pygame.event.get():
-            if not isinstance(event, pygame.event.Event):
-                continue
-            if event.type == pygame.QUIT:
-                # 处理退出事件
-                pass
-            elif event.type == pygame.KEYDOWN:
-                key = event.key
-                if key not in self.keys_pressed:
-                    self.keys_pressed.add(key)
-                    self.keys_down.add(key)
-                    self._trigger_key_down_callbacks(key)
-            elif event.type == pygame.KEYUP:
-                key = event.key
-                if key in self.keys_pressed:
-                    self.keys_pressed.remove(key)
-                    self.keys_up.add(key)
-                    self._trigger_key_up_callbacks(key)
-            elif event.type == pygame.MOUSEMOTION:
-                prev_position = self.mouse_position
-                self.mouse_position = event.pos
-                self.mouse_delta = (
-                    self.mouse_position[0] - prev_position[0],
-                    self.mouse_position[1] - prev_position[1]
-                )
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                button = event.button
-                if button not in self.mouse_buttons_pressed:
-                    self.mouse_buttons_pressed.add(button)
-                    self.mouse_buttons_down.add(button)
-                    self._trigger_mouse_down_callbacks(button, event.pos)
-            elif event.type == pygame.MOUSEBUTTONUP:
-                button = event.button
-                if button in self.mouse_buttons_pressed:
-                    self.mouse_buttons_pressed.remove(button)
-                    self.mouse_buttons_up.add(button)
-                    self._trigger_mouse_up_callbacks(button, event.pos)
-            elif event.type == pygame.MOUSEWHEEL:
-                self.mouse_wheel_delta = event.y
-                
-    def _trigger_key_down_callbacks(self, key: int):
-        """触发按键按下回调"""
-        if key in self.on_key_down_callbacks:
-            for callback in self.on_key_down_callbacks[key]:
-                callback()
-                
-    def _trigger_key_up_callbacks(self, key: int):
-        """触发按键释放回调"""
-        if key in self.on_key_up_callbacks:
-            for callback in self.on_key_up_callbacks[key]:
-                callback()
-                
-    def _trigger_mouse_down_callbacks(self, button: int, position: Tuple[int, int]):
-        """触发鼠标按下回调"""
-        if button in self.on_mouse_down_callbacks:
-            for callback in self.on_mouse_down_callbacks[button]:
-                callback(position)
-                
-    def _trigger_mouse_up_callbacks(self, button: int, position: Tuple[int, int]):
-        """触发鼠标释放回调"""
-        if button in self.on_mouse_up_callbacks:
-            for callback in self.on_mouse_up_callbacks[button]:
-                callback(position)
-                
+        self.mouse_delta = (0, 0)
+        self._transient_active = False
+
+        # 处理事件，按事件类型查表分发。pygame队列不会产出非Event对象，
+        # 不再对每个事件做isinstance检查；把绑定方法提升为局部变量，
+        # 循环内只剩LOAD_FAST
+        dispatch_get = self._event_dispatch.get
+        for event in events:
+            handler = dispatch_get(event.type)
+            if handler is not None:
+                handler(event)
+
+    def wait_update(self, timeout_ms: int = 16) -> None:
+        """
+        阻塞式更新：在内核里等待下一个事件（最多timeout_ms毫秒）再统一处理。
+        适合菜单、暂停等空闲场景，避免忙轮询烧掉一整个核心。
+        """
+        if pygame.version.vernum < (2, 1, 3):
+            # 旧版pygame的event.wait不支持超时参数，退回普通轮询
+            self.update(pygame.event.get())
+            return
+
+        event = pygame.event.wait(timeout_ms)
+        if event.type != pygame.NOEVENT:
+            events = [event]
+            events.extend(pygame.event.get())
+            self.update(events)
+        else:
+            # 超时无事件，仍要清空本帧瞬时状态
+            self.update([])
+
+    def restrict_event_types(self) -> None:
+        """
+        在SDL层屏蔽输入系统不关心的事件类型，被屏蔽的事件根本不会入队。
+        仅适合没有UI的游戏：pygame_gui和主循环的VIDEORESIZE等
+        窗口事件也会被一并丢弃，编辑器模式下不要调用。
+        """
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._handled_types)
+
+    def set_pump_fps(self, fps: int) -> None:
+        """
+        设置事件pump的节流频率，通常与目标帧率一致。
+        实际间隔取帧周期的一半，保证略短于整帧的正常帧也能pump到
+        """
+        self._pump_interval = 0.5 / max(1, fps)
+
+    def poll_and_tick(self) -> List[pygame.event.Event]:
+        """
+        在帧开始处取出全部pygame事件并更新输入状态，返回事件列表
+        供调用方继续分发（如UI、退出处理）。
+        这是唯一的pump点，节流也在这里：距上次pump不足半个目标帧周期时
+        不进内核，事件留在队列里下一帧再取。正常节奏的每一帧都会pump，
+        节流只挡住同一帧内的重复调用。
+        """
+        now = time.monotonic()
+        if now - self._last_pump_time < self._pump_interval:
+            events: List[pygame.event.Event] = []
+        else:
+            self._last_pump_time = now
+            events = pygame.event.get()
+        self.update(events)
+        return events
+
+    def _on_key_down(self, event: pygame.event.Event) -> None:
+        """处理KEYDOWN事件"""
+        # 读-改-写合并成一次字节访问：先取旧位再置位，省去单独的成员测试
+        key = event.key
+        index = _key_index(key)
+        byte = index >> 3
+        mask = 1 << (index & 7)
+        prev = self.keys_pressed[byte] & mask
+        self.keys_pressed[byte] |= mask
+        if not prev:
+            self.keys_down[byte] |= mask
+            self._transient_active = True
+            registry = self._callbacks
+            if registry is not None:
+                callbacks = registry.key_down.get(key)
+                if callbacks:
+                    for callback in callbacks:
+                        callback()
+
+    def _on_key_up(self, event: pygame.event.Event) -> None:
+        """处理KEYUP事件"""
+        key = event.key
+        index = _key_index(key)
+        byte = index >> 3
+        mask = 1 << (index & 7)
+        if self.keys_pressed[byte] & mask:
+            self.keys_pressed[byte] &= ~mask & 0xFF
+            self.keys_up[byte] |= mask
+            self._transient_active = True
+            registry = self._callbacks
+            if registry is not None:
+                callbacks = registry.key_up.get(key)
+                if callbacks:
+                    for callback in callbacks:
+                        callback()
+
+    def _on_mouse_motion(self, event: pygame.event.Event) -> None:
+        """处理MOUSEMOTION事件"""
+        # 高回报率鼠标一帧会产生多个MOUSEMOTION，累加rel得到整帧位移，
+        # 只保留最后一段会丢失中间移动
+        rel = event.rel
+        delta = self.mouse_delta
+        self.mouse_delta = (delta[0] + rel[0], delta[1] + rel[1])
+        self.mouse_position = event.pos
+
+    def _on_mouse_button_down(self, event: pygame.event.Event) -> None:
+        """处理MOUSEBUTTONDOWN事件"""
+        button = event.button
+        byte = button >> 3
+        mask = 1 << (button & 7)
+        prev = self.mouse_buttons_pressed[byte] & mask
+        self.mouse_buttons_pressed[byte] |= mask
+        if not prev:
+            self.mouse_buttons_down[byte] |= mask
+            self._transient_active = True
+            registry = self._callbacks
+            if registry is not None:
+                callbacks = registry.mouse_down.get(button)
+                if callbacks:
+                    position = event.pos
+                    for callback in callbacks:
+                        callback(position)
+
+    def _on_mouse_button_up(self, event: pygame.event.Event) -> None:
+        """处理MOUSEBUTTONUP事件"""
+        button = event.button
+        byte = button >> 3
+        mask = 1 << (button & 7)
+        if self.mouse_buttons_pressed[byte] & mask:
+            self.mouse_buttons_pressed[byte] &= ~mask & 0xFF
+            self.mouse_buttons_up[byte] |= mask
+            self._transient_active = True
+            registry = self._callbacks
+            if registry is not None:
+                callbacks = registry.mouse_up.get(button)
+                if callbacks:
+                    position = event.pos
+                    for callback in callbacks:
+                        callback(position)
+
+    def _on_mouse_wheel(self, event: pygame.event.Event) -> None:
+        """处理MOUSEWHEEL事件"""
+        self.mouse_wheel_delta = event.y
+
     def is_key_pressed(self, key: int) -> bool:
         """检查按键是否按下"""
-        return key in self.keys_pressed
-        
+        return _bit_test(self.keys_pressed, _key_index(key))
+
     def is_key_down(self, key: int) -> bool:
         """检查按键是否在这一帧按下"""
-        return key in self.keys_down
-        
+        return _bit_test(self.keys_down, _key_index(key))
+
     def is_key_up(self, key: int) -> bool:
         """检查按键是否在这一帧释放"""
-        return key in self.keys_up
-        
+        return _bit_test(self.keys_up, _key_index(key))
+
     def is_mouse_button_pressed(self, button: int) -> bool:
         """检查鼠标按钮是否按下"""
-        return button in self.mouse_buttons_pressed
-        
+        return _bit_test(self.mouse_buttons_pressed, button)
+
     def is_mouse_button_down(self, button: int) -> bool:
         """检查鼠标按钮是否在这一帧按下"""
-        return button in self.mouse_buttons_down
-        
+        return _bit_test(self.mouse_buttons_down, button)
+
     def is_mouse_button_up(self, button: int) -> bool:
         """检查鼠标按钮是否在这一帧释放"""
-        return button in self.mouse_buttons_up
+        return _bit_test(self.mouse_buttons_up, button)
         
     def get_mouse_position(self) -> Tuple[int, int]:
         """获取鼠标位置"""
@@ -143,49 +355,85 @@ class InputSystem:
         """获取鼠标滚轮增量"""
         return self.mouse_wheel_delta
         
+    def _ensure_callbacks(self) -> _InputCallbacks:
+        """首次注册回调时创建注册表"""
+        if self._callbacks is None:
+            self._callbacks = _InputCallbacks()
+        return self._callbacks
+
     def add_on_key_down_callback(self, key: int, callback: Callable[[], None]) -> None:
         """添加按键按下回调"""
-        if key not in self.on_key_down_callbacks:
-            self.on_key_down_callbacks[key] = []
-        self.on_key_down_callbacks[key].append(callback)
-        
+        registry = self._ensure_callbacks()
+        registry.key_down[key] = registry.key_down.get(key, ()) + (callback,)
+
     def add_on_key_up_callback(self, key: int, callback: Callable[[], None]) -> None:
         """添加按键释放回调"""
-        if key not in self.on_key_up_callbacks:
-            self.on_key_up_callbacks[key] = []
-        self.on_key_up_callbacks[key].append(callback)
-        
+        registry = self._ensure_callbacks()
+        registry.key_up[key] = registry.key_up.get(key, ()) + (callback,)
+
     def add_on_mouse_down_callback(self, button: int, callback: Callable[[Tuple[int, int]], None]) -> None:
         """添加鼠标按下回调"""
-        if button not in self.on_mouse_down_callbacks:
-            self.on_mouse_down_callbacks[button] = []
-        self.on_mouse_down_callbacks[button].append(callback)
-        
+        registry = self._ensure_callbacks()
+        registry.mouse_down[button] = registry.mouse_down.get(button, ()) + (callback,)
+
     def add_on_mouse_up_callback(self, button: int, callback: Callable[[Tuple[int, int]], None]) -> None:
         """添加鼠标释放回调"""
-        if button not in self.on_mouse_up_callbacks:
-            self.on_mouse_up_callbacks[button] = []
-        self.on_mouse_up_callbacks[button].append(callback)
+        registry = self._ensure_callbacks()
+        registry.mouse_up[button] = registry.mouse_up.get(button, ()) + (callback,)
         
     def define_axis(self, name: str, positive_key: int, negative_key: int, 
                   sensitivity: float = 1.0) -> None:
         """定义输入轴（例如水平移动、垂直移动）"""
-        if name not in self.axis_mappings:
-            self.axis_mappings[name] = []
-        self.axis_mappings[name].append((positive_key, negative_key, sensitivity))
-        
+        # setdefault一次探测完成取或建，代替"in测试+赋值+取值"三连
+        mappings = self.axis_mappings.setdefault(name, [])
+        mappings.append((positive_key, negative_key, sensitivity))
+
+        # 重建该轴的编译数组，get_axis不再逐元组解包
+        self._axis_compiled[name] = (
+            np.array([_key_index(pos) for pos, _, _ in mappings], dtype=np.int32),
+            np.array([_key_index(neg) for _, neg, _ in mappings], dtype=np.int32),
+            np.array([sens for _, _, sens in mappings], dtype=np.float32),
+        )
+
+        # 轴通常在启动时定义一次，这里顺带预热JIT，首次get_axis不付编译开销
+        if _axis_kernel is not None:
+            pos, neg, sens = self._axis_compiled[name]
+            _axis_kernel(np.frombuffer(self.keys_pressed, dtype=np.uint8), pos, neg, sens)
+
     def get_axis(self, name: str) -> float:
         """获取输入轴的值（范围-1到1）"""
-        if name not in self.axis_mappings:
+        mappings = self.axis_mappings.get(name)
+        if mappings is None:
             return 0.0
-            
-        value = 0.0
-        for mapping in self.axis_mappings[name]:
-            positive_key, negative_key, sensitivity = mapping
-            if self.is_key_pressed(positive_key):
-                value += sensitivity
-            if self.is_key_pressed(negative_key):
-                value -= sensitivity
-                
+
+        if _axis_kernel is not None:
+            # JIT内核直接扫位图，小轴也比解释执行快
+            pos, neg, sens = self._axis_compiled[name]
+            return float(_axis_kernel(
+                np.frombuffer(self.keys_pressed, dtype=np.uint8), pos, neg, sens
+            ))
+
+        if len(mappings) >= 4:
+            # 映射较多时向量化计算：把按键位图展开成0/1数组，
+            # 轴值就是sens·(pressed[pos] - pressed[neg])
+            pos, neg, sens = self._axis_compiled[name]
+            bits = np.unpackbits(
+                np.frombuffer(self.keys_pressed, dtype=np.uint8), bitorder='little'
+            ).astype(np.float32)
+            value = float(sens.dot(bits[pos] - bits[neg]))
+        else:
+            # 少量映射时numpy的调用开销反而更高，保留标量路径
+            value = 0.0
+            for positive_key, negative_key, sensitivity in mappings:
+                if self.is_key_pressed(positive_key):
+                    value += sensitivity
+                if self.is_key_pressed(negative_key):
+                    value -= sensitivity
+
         # 限制范围到[-1, 1]
         return max(-1.0, min(1.0, value))
+
+
+# 模块级共享实例：热代码直接 `from ...input_system import input_system`，
+# 免去每次InputSystem()调用的单例守卫分支；InputSystem()仍返回同一实例
+input_system = InputSystem()
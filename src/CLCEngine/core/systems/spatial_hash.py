@@ -0,0 +1,66 @@
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..build_in_components.collider import Collider
+
+class SpatialHashGrid:
+    """
+    空间哈希网格，用于碰撞检测的粗检测（broadphase）阶段。
+    将碰撞器的AABB插入到网格单元中，只有位于同一单元的碰撞器才会被视为候选碰撞对，
+    从而将碰撞对数量从O(N²)降低到约O(kN)。
+    """
+    def __init__(self, cell_size: float = 128.0):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List['Collider']] = {}
+        self._count = 0
+
+    def clear(self) -> None:
+        """清空网格，复用已有的单元列表以减少GC压力"""
+        for bucket in self._cells.values():
+            bucket.clear()
+        self._count = 0
+
+    def insert(self, collider: 'Collider', aabb: Tuple[float, float, float, float]) -> None:
+        """
+        将碰撞器按其AABB插入到覆盖的所有网格单元中
+
+        Args:
+            collider: 碰撞器
+            aabb: (min_x, min_y, max_x, max_y)
+        """
+        min_x, min_y, max_x, max_y = aabb
+        cell_size = self.cell_size
+        cells = self._cells
+
+        for cx in range(int(min_x // cell_size), int(max_x // cell_size) + 1):
+            for cy in range(int(min_y // cell_size), int(max_y // cell_size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    bucket = []
+                    cells[(cx, cy)] = bucket
+                bucket.append(collider)
+
+        self._count += 1
+
+    def query_pairs(self) -> Iterator[Tuple['Collider', 'Collider']]:
+        """
+        遍历所有网格单元，生成唯一的候选碰撞对
+
+        Returns:
+            候选碰撞对 (a, b) 的迭代器，每对只出现一次
+        """
+        seen = set()
+        for bucket in self._cells.values():
+            bucket_len = len(bucket)
+            if bucket_len < 2:
+                continue
+            for i in range(bucket_len):
+                a = bucket[i]
+                for j in range(i + 1, bucket_len):
+                    b = bucket[j]
+                    # 用id排序保证同一对在跨单元时只生成一次
+                    key = (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield a, b
@@ -15,7 +15,9 @@ class TimeSystem:
     
     def _init_singleton(self):
         """初始化单例"""
-        self.start_time = time.time()
+        # perf_counter单调且分辨率高；time.time()受NTP校时影响，
+        # 在部分平台上粒度只有毫秒级，会造成dt抖动甚至为负
+        self.start_time = time.perf_counter()
         self.current_time = self.start_time
         self.previous_time = self.start_time
         self.delta_time = 0.0
@@ -28,12 +30,17 @@ class TimeSystem:
         self.frames_since_last_fps_update = 0
         self.max_delta_time = 0.1  # 最大帧时间，用于防止大延迟
         self.target_fps = 60  # 目标帧率
+        self._target_frame_interval = 1.0 / 60.0  # 目标帧周期，随set_target_fps更新
         self.vsync_enabled = True  # 是否启用垂直同步
+        # 固定步长累加器：每帧把delta_time累进去，整除出应执行的固定更新次数，
+        # 避免浮点取模的开销和跨步长边界时的抖动
+        self._fixed_accumulator = 0.0
+        self._fixed_steps_due = 0
         
     def update(self):
         """更新时间系统，每帧调用"""
         self.previous_time = self.current_time
-        self.current_time = time.time()
+        self.current_time = time.perf_counter()
         
         # 计算实际帧时间
         raw_delta_time = self.current_time - self.previous_time
@@ -44,6 +51,12 @@ class TimeSystem:
         # 应用时间缩放
         self.delta_time = clamped_delta_time * self.time_scale
         
+        # 结算本帧应执行的固定更新次数（Gaffer式固定时间步长）
+        self._fixed_accumulator += self.delta_time
+        steps = int(self._fixed_accumulator / self.fixed_delta_time)
+        self._fixed_accumulator -= steps * self.fixed_delta_time
+        self._fixed_steps_due = steps
+
         # 更新帧计数
         self.frame_count += 1
         self.frames_since_last_fps_update += 1
@@ -84,13 +97,33 @@ class TimeSystem:
         self.fixed_delta_time = max(0.001, fixed_delta_time)
         
     def set_target_fps(self, fps: int) -> None:
-        """设置目标帧率"""
+        """设置目标帧率，同时同步输入系统的事件pump节流频率"""
         self.target_fps = max(1, fps)
+        # 帧周期在设置时算好，热路径消费方只读属性，不做每帧除法
+        self._target_frame_interval = 1.0 / self.target_fps
+        # 局部导入避免模块级循环依赖
+        from .input_system import input_system
+        input_system.set_pump_fps(self.target_fps)
+
+    def get_target_frame_interval(self) -> float:
+        """获取目标帧周期（秒），即1/target_fps的预计算值"""
+        return self._target_frame_interval
         
     def set_vsync(self, enabled: bool) -> None:
         """设置是否启用垂直同步"""
         self.vsync_enabled = enabled
         
     def should_run_fixed_update(self) -> bool:
-        """检查是否应该运行固定更新"""
-        return self.get_time() % self.fixed_delta_time < self.delta_time
+        """
+        检查是否应该运行固定更新。
+        每次调用消耗一个待执行步数，调用方可以循环调用直到返回False，
+        保证每帧恰好补齐应有的固定更新次数。
+        """
+        if self._fixed_steps_due:
+            self._fixed_steps_due -= 1
+            return True
+        return False
+
+
+# 模块级共享实例，与input_system同理
+time_system = TimeSystem()
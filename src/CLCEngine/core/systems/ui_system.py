@@ -9,23 +9,50 @@ from .input_system import InputSystem
 from ..systems.event_system import Event, EventArgs
 
 class UIEventArgs(EventArgs):
-    """UI事件参数"""
+    """
+    UI事件参数。
+    分发时复用池化实例，回调内同步消费，不要保存引用；
+    需要留存时自行拷贝字段。
+    """
+    __slots__ = ('ui_element', 'ui_id')
+
     def __init__(self, ui_element: Any, ui_id: str = ""):
         self.ui_element = ui_element
         self.ui_id = ui_id
 
 class UISelectionEventArgs(UIEventArgs):
     """UI选择事件参数"""
+    __slots__ = ('selection',)
+
     def __init__(self, ui_element: Any, ui_id: str, selection: str):
         super().__init__(ui_element, ui_id)
         self.selection = selection
 
 class UIValueEventArgs(UIEventArgs):
     """UI值改变事件参数"""
+    __slots__ = ('value',)
+
     def __init__(self, ui_element: Any, ui_id: str, value: Any):
         super().__init__(ui_element, ui_id)
         self.value = value
 
+# 布局元素的默认ObjectID只建一次，批量建UI时省去每个布局的小对象分配
+_DEFAULT_LAYOUT_OID = ObjectID(object_id="#layout_element", class_id="@layout")
+
+# 各元素类型的默认ObjectID，同样只建一次共享。传None会让pygame_gui
+# 每个元素内部现拼一个默认ID（字符串构造+主题键哈希），共享常量则
+# 命中主题引擎对该ID的样式缓存
+_DEFAULT_OIDS: Dict[str, ObjectID] = {
+    t: ObjectID(object_id=f"#default_{t}", class_id=f"@{t}")
+    for t in ('button', 'label', 'text_entry', 'dropdown', 'selection_list',
+              'slider', 'panel', 'window', 'text_box', 'image')
+}
+
+# with布局语法用的父容器栈。模块级列表，enter/exit走一次全局名查找，
+# 不经过"类属性+实例"的双重间接
+_PARENT_STACK: List[Optional[pygame_gui.core.UIContainer]] = []
+
+
 class UILayoutElement(pygame_gui.core.UIContainer):
     """UI布局类，用于管理UI元素的布局和位置"""
     def __init__(self, 
@@ -53,14 +80,14 @@ class UILayoutElement(pygame_gui.core.UIContainer):
                          container=container,
                          parent_element=parent,
                          anchors=anchors,
-                         object_id=kwargs.get("object_id", ObjectID(object_id="#layout_element", class_id="@layout")))
+                         object_id=kwargs.get("object_id", _DEFAULT_LAYOUT_OID))
 
     def __enter__(self):
-        UISystem._parent_stack.append(self)
+        _PARENT_STACK.append(self)
         return self
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if UISystem._parent_stack and UISystem._parent_stack[-1] == self:
-            UISystem._parent_stack.pop()
+        if _PARENT_STACK and _PARENT_STACK[-1] is self:
+            _PARENT_STACK.pop()
         return False
 
 class HorizontalLayout(UILayoutElement):
@@ -96,19 +123,73 @@ class VerticalLayout(UILayoutElement):
                          expand_with=expand_with,)
         self.spacing = 10  # 子元素之间的间距
 
+def _create_text_entry(manager, rect, container, kwargs):
+    """文本输入框需要在构造后再设置初始文本，单独成函数"""
+    element = pygame_gui.elements.UITextEntryLine(
+        relative_rect=rect,
+        manager=manager,
+        container=container,
+        object_id=kwargs.get('object_id') or _DEFAULT_OIDS['text_entry']
+    )
+    if 'text' in kwargs:
+        element.set_text(kwargs['text'])
+    return element
+
+
 class UISystem:
     """
     UI系统，用于创建和管理游戏中的用户界面
     支持通用UI元素以及编辑器界面
     """
     _instance: Optional['UISystem'] = None
-    _parent_stack: List[Optional[pygame_gui.core.UIContainer]] = []  # 用于存储父容器的栈
+    _parent_stack = _PARENT_STACK  # 兼容别名，实际栈在模块级
+
+    # element_type -> 工厂函数的分发表，每个工厂接收(manager, rect, container, kwargs)。
+    # 创建路径一次查表，代替逐个字符串比较的if/elif链
+    _FACTORIES: Dict[str, Callable] = {
+        'horizontal_layout': lambda manager, rect, container, kwargs: HorizontalLayout(
+            relative_rect=rect, manager=manager, container=container, **kwargs),
+        'vertical_layout': lambda manager, rect, container, kwargs: VerticalLayout(
+            relative_rect=rect, manager=manager, container=container, **kwargs),
+        'button': lambda manager, rect, container, kwargs: pygame_gui.elements.UIButton(
+            relative_rect=rect, text=kwargs.get('text', ''), manager=manager,
+            container=container, object_id=kwargs.get('object_id') or _DEFAULT_OIDS['button']),
+        'label': lambda manager, rect, container, kwargs: pygame_gui.elements.UILabel(
+            relative_rect=rect, text=kwargs.get('text', ''), manager=manager,
+            container=container, object_id=kwargs.get('object_id') or _DEFAULT_OIDS['label']),
+        'text_entry': _create_text_entry,
+        'dropdown': lambda manager, rect, container, kwargs: pygame_gui.elements.UIDropDownMenu(
+            options_list=kwargs.get('options', []),
+            starting_option=kwargs.get('starting_option', None),
+            relative_rect=rect, manager=manager,
+            container=container, object_id=kwargs.get('object_id') or _DEFAULT_OIDS['dropdown']),
+        'selection_list': lambda manager, rect, container, kwargs: pygame_gui.elements.UISelectionList(
+            relative_rect=rect, item_list=kwargs.get('items', []), manager=manager,
+            container=container, object_id=kwargs.get('object_id') or _DEFAULT_OIDS['selection_list']),
+        'slider': lambda manager, rect, container, kwargs: pygame_gui.elements.UIHorizontalSlider(
+            relative_rect=rect, start_value=kwargs.get('start_value', 0),
+            value_range=kwargs.get('value_range', (0, 100)), manager=manager,
+            container=container, object_id=kwargs.get('object_id') or _DEFAULT_OIDS['slider']),
+        'panel': lambda manager, rect, container, kwargs: pygame_gui.elements.UIPanel(
+            relative_rect=rect, manager=manager,
+            starting_layer_height=kwargs.get('starting_height', 1),
+            container=container, object_id=kwargs.get('object_id') or _DEFAULT_OIDS['panel']),
+        'window': lambda manager, rect, container, kwargs: pygame_gui.elements.UIWindow(
+            rect=rect, manager=manager,
+            window_display_title=kwargs.get('title', ''),
+            object_id=kwargs.get('object_id') or _DEFAULT_OIDS['window']),
+        'text_box': lambda manager, rect, container, kwargs: pygame_gui.elements.UITextBox(
+            html_text=kwargs.get('text', ''), relative_rect=rect, manager=manager,
+            container=container, object_id=kwargs.get('object_id') or _DEFAULT_OIDS['text_box']),
+        'image': lambda manager, rect, container, kwargs: pygame_gui.elements.UIImage(
+            relative_rect=rect, image_surface=kwargs.get('image', None), manager=manager,
+            container=container, object_id=kwargs.get('object_id') or _DEFAULT_OIDS['image']),
+    }
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(UISystem, cls).__new__(cls)
             cls._instance._init_singleton()
-            cls._parent_stack = []
         return cls._instance
     
     def _init_singleton(self):
@@ -119,9 +200,22 @@ class UISystem:
         
         # UI元素字典，通过ID引用
         self.elements: Dict[str, pygame_gui.core.UIElement] = {}
+        # 反向表：id(element) -> element_id，事件分发O(1)查找，
+        # 不随元素数量线性扫描
+        self._element_to_id: Dict[int, str] = {}
         
         # UI元素组，用于组织UI元素
         self.groups: Dict[str, Dict[str, pygame_gui.core.UIElement]] = {}
+        # 与groups平行维护的纯元素列表：hide/show等批量操作只迭代值，
+        # 列表迭代比字典迭代省去哈希桶遍历，局部性也更好
+        self._group_elements_list: Dict[str, List[pygame_gui.core.UIElement]] = {}
+        # 反向表：element_id -> 所属组ID集合，移除元素时不用遍历所有组
+        self._element_groups: Dict[str, set] = {}
+        # 文本能力缓存（位标志）：1=有set_text，4=有get_text，2=UITextBox。
+        # 创建时判定一次，读写文本不再走hasattr/isinstance
+        self._text_caps: Dict[str, int] = {}
+        # 组可见性状态，重复hide/show同一组时直接早退
+        self._group_visible: Dict[str, bool] = {}
         
         # 事件系统
         self.on_button_clicked = Event[UIEventArgs]("ui_button_clicked")
@@ -129,7 +223,27 @@ class UISystem:
         self.on_selection_list_changed = Event[UISelectionEventArgs]("ui_selection_list_changed")
         self.on_text_entry_changed = Event[UIValueEventArgs]("ui_text_entry_changed")
         self.on_slider_moved = Event[UIValueEventArgs]("ui_slider_moved")
-        
+
+        # 池化的事件参数实例：高频输入（拖滑块、打字）不再每事件分配小对象。
+        # 回调同步消费完即失效，见UIEventArgs的文档约定
+        self._btn_args = UIEventArgs(None)
+        self._sel_args = UISelectionEventArgs(None, '', '')
+        self._val_args = UIValueEventArgs(None, '', None)
+
+        # pygame_gui事件类型 -> (池化参数, 触发函数, 事件取值属性, 参数字段)的分发表。
+        # 直接存各事件绑定好的invoke，触发时不再经过on_*属性查找；
+        # 绝大多数事件（鼠标移动等）查表得None直接返回，不走分支链
+        self._gui_dispatch = {
+            pygame_gui.UI_BUTTON_PRESSED: (self._btn_args, self.on_button_clicked.invoke, None, None),
+            pygame_gui.UI_DROP_DOWN_MENU_CHANGED: (self._sel_args, self.on_dropdown_selected.invoke, 'text', 'selection'),
+            pygame_gui.UI_SELECTION_LIST_NEW_SELECTION: (self._sel_args, self.on_selection_list_changed.invoke, 'text', 'selection'),
+            pygame_gui.UI_TEXT_ENTRY_CHANGED: (self._val_args, self.on_text_entry_changed.invoke, 'text', 'value'),
+            pygame_gui.UI_HORIZONTAL_SLIDER_MOVED: (self._val_args, self.on_slider_moved.invoke, 'value', 'value'),
+        }
+        # 关心的GUI事件类型区间，区间外（普通鼠标/键盘事件）两次整数比较就出局
+        self._gui_event_lo = min(self._gui_dispatch)
+        self._gui_event_hi = max(self._gui_dispatch)
+
     def initialize(self, screen_size: Tuple[int, int], theme_path: str = None):
         """初始化UI系统"""
         self.screen_size = screen_size
@@ -137,14 +251,32 @@ class UISystem:
         self.manager = pygame_gui.UIManager(screen_size,
                                             theme_path=theme_path,
                                             starting_language='zh')
-       
+        # manager就绪后把每帧入口换成不带None守卫的实现，
+        # 守卫只在初始化前生效，不再出现在热路径里
+        self.update = self._update_live
+        self.draw = self._draw_live
+        self.process_events = self._process_events_live
+
+    def set_window_resolution(self, screen_size: Tuple[int, int]):
+        """
+        窗口尺寸变化时更新UI分辨率。
+        只调整manager的分辨率，不重建manager、不重新读主题文件
+        """
+        self.screen_size = screen_size
+        if self.manager is not None:
+            self.manager.set_window_resolution(screen_size)
+        else:
+            self.initialize(screen_size)
+
     def update(self, delta_time: float):
+        """更新UI系统（初始化前的空实现，initialize后被替换）"""
+        if self.manager is not None:
+            self._update_live(delta_time)
+
+    def _update_live(self, delta_time: float):
         """更新UI系统"""
-        if self.manager is None:
-            return
-            
         self.manager.update(delta_time)
-    
+
     def set_theme(self, theme_path: str):
         """设置UI主题"""
         if self.manager is None:
@@ -167,44 +299,51 @@ class UISystem:
             element.rebuild()
     
     def process_events(self, event: pygame.event.Event):
+        """处理UI事件（初始化前的守卫版本，initialize后被替换）"""
+        if self.manager is not None:
+            self._process_events_live(event)
+
+    def _process_events_live(self, event: pygame.event.Event):
         """处理UI事件"""
-        if self.manager is None:
-            return
-            
         self.manager.process_events(event)
-        
-        # 处理pygame_gui生成的事件
-        if event.type == pygame_gui.UI_BUTTON_PRESSED:
-            for element_id, element in self.elements.items():
-                if event.ui_element == element:
-                    self.on_button_clicked.invoke(self, UIEventArgs(element, element_id))
-                    
-        elif event.type == pygame_gui.UI_DROP_DOWN_MENU_CHANGED:
-            for element_id, element in self.elements.items():
-                if event.ui_element == element:
-                    self.on_dropdown_selected.invoke(self, UISelectionEventArgs(element, element_id, event.text))
-                    
-        elif event.type == pygame_gui.UI_SELECTION_LIST_NEW_SELECTION:
-            for element_id, element in self.elements.items():
-                if event.ui_element == element:
-                    self.on_selection_list_changed.invoke(self, UISelectionEventArgs(element, element_id, event.text))
-                    
-        elif event.type == pygame_gui.UI_TEXT_ENTRY_CHANGED:
-            for element_id, element in self.elements.items():
-                if event.ui_element == element:
-                    self.on_text_entry_changed.invoke(self, UIValueEventArgs(element, element_id, event.text))
-                    
-        elif event.type == pygame_gui.UI_HORIZONTAL_SLIDER_MOVED:
-            for element_id, element in self.elements.items():
-                if event.ui_element == element:
-                    self.on_slider_moved.invoke(self, UIValueEventArgs(element, element_id, event.value))
-        
-    def draw(self, screen: pygame.Surface):
-        """绘制UI"""
-        if self.manager is None:
+
+        # GUI事件类型区间外的事件（鼠标移动等大多数）直接返回
+        event_type = event.type
+        if event_type < self._gui_event_lo or event_type > self._gui_event_hi:
             return
-            
+
+        # 处理pygame_gui生成的事件：查分发表+反向表，O(1)完成。
+        # 命中区间后才把self属性绑到局部名，冷路径不付这笔开销
+        entry = self._gui_dispatch.get(event_type)
+        if entry is None:
+            return
+
+        ui_element = event.ui_element
+        element_id = self._element_to_id.get(id(ui_element))
+        if element_id is None:
+            return
+
+        pooled, fire, event_attr, args_attr = entry
+        pooled.ui_element = ui_element
+        pooled.ui_id = element_id
+        if event_attr is not None:
+            setattr(pooled, args_attr, getattr(event, event_attr))
+        fire(self, pooled)
+        
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """绘制UI（初始化前的守卫版本，initialize后被替换）"""
+        if self.manager is not None:
+            return self._draw_live(screen)
+        return []
+
+    def _draw_live(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """绘制UI，返回本帧UI产生的脏矩形列表"""
         self.manager.draw_ui(screen)
+        # pygame_gui不上报各元素的重绘区域，有元素时整屏记脏；
+        # 完全没有UI元素时该层不贡献脏区域
+        if self.elements:
+            return [screen.get_rect()]
+        return []
         
     def clear(self):
         """清除所有UI元素"""
@@ -213,7 +352,12 @@ class UISystem:
             
         self.manager.clear_and_reset()
         self.elements.clear()
+        self._element_to_id.clear()
         self.groups.clear()
+        self._group_elements_list.clear()
+        self._element_groups.clear()
+        self._text_caps.clear()
+        self._group_visible.clear()
         
     def create_element(self, element_type: str, element_id: str, rect: pygame.Rect, 
                       container: Optional[pygame_gui.core.UIContainer] = None, 
@@ -233,104 +377,30 @@ class UISystem:
         """
         if self.manager is None:
             return None
-            
-        element = None
-        if element_type == "horizontal_layout":
-            element = HorizontalLayout(relative_rect=rect, manager=self.manager, container=container, **kwargs)
-        elif element_type == "vertical_layout":
-            element = VerticalLayout(relative_rect=rect, manager=self.manager, container=container, **kwargs)
-        elif element_type == 'button':
-            element = pygame_gui.elements.UIButton(
-                relative_rect=rect,
-                text=kwargs.get('text', ''),
-                manager=self.manager,
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-        elif element_type == 'label':
-            element = pygame_gui.elements.UILabel(
-                relative_rect=rect,
-                text=kwargs.get('text', ''),
-                manager=self.manager,
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-        elif element_type == 'text_entry':
-            element = pygame_gui.elements.UITextEntryLine(
-                relative_rect=rect,
-                manager=self.manager,
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-            if 'text' in kwargs:
-                element.set_text(kwargs['text'])
-        elif element_type == 'dropdown':
-            element = pygame_gui.elements.UIDropDownMenu(
-                options_list=kwargs.get('options', []),
-                starting_option=kwargs.get('starting_option', None),
-                relative_rect=rect,
-                manager=self.manager,
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-        elif element_type == 'selection_list':
-            element = pygame_gui.elements.UISelectionList(
-                relative_rect=rect,
-                item_list=kwargs.get('items', []),
-                manager=self.manager,
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-        elif element_type == 'slider':
-            element = pygame_gui.elements.UIHorizontalSlider(
-                relative_rect=rect,
-                start_value=kwargs.get('start_value', 0),
-                value_range=kwargs.get('value_range', (0, 100)),
-                manager=self.manager,
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-        elif element_type == 'panel':
-            element = pygame_gui.elements.UIPanel(
-                relative_rect=rect,
-                manager=self.manager,
-                starting_layer_height=kwargs.get('starting_height', 1),
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-        elif element_type == 'window':
-            element = pygame_gui.elements.UIWindow(
-                rect=rect,
-                manager=self.manager,
-                window_display_title=kwargs.get('title', ''),
-                object_id=kwargs.get('object_id', None)
-            )
-        elif element_type == 'text_box':
-            element = pygame_gui.elements.UITextBox(
-                html_text=kwargs.get('text', ''),
-                relative_rect=rect,
-                manager=self.manager,
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-        elif element_type == 'image':
-            element = pygame_gui.elements.UIImage(
-                relative_rect=rect,
-                image_surface=kwargs.get('image', None),
-                manager=self.manager,
-                container=container,
-                object_id=kwargs.get('object_id', None)
-            )
-            
+
+        factory = self._FACTORIES.get(element_type)
+        element = factory(self.manager, rect, container, kwargs) if factory is not None else None
+
         if element is not None:
             self.elements[element_id] = element
-            
+            self._element_to_id[id(element)] = element_id
+            # 在元素上记下创建类型，后续类型判断用字符串身份比较，
+            # 不再走isinstance的MRO查找
+            element._clc_type = element_type
+            if element_type == 'text_box':
+                self._text_caps[element_id] = 2
+            else:
+                cap = (1 if hasattr(element, 'set_text') else 0) | \
+                      (4 if hasattr(element, 'get_text') else 0)
+                if cap:
+                    self._text_caps[element_id] = cap
+
             # 如果有组名，添加到组中
             group_name = kwargs.get('group', None)
             if group_name:
-                if group_name not in self.groups:
-                    self.groups[group_name] = {}
-                self.groups[group_name][element_id] = element
+                self.groups.setdefault(group_name, {})[element_id] = element
+                self._group_elements_list.setdefault(group_name, []).append(element)
+                self._element_groups.setdefault(element_id, set()).add(group_name)
                 
         return element
         
@@ -360,15 +430,16 @@ class UISystem:
         element = self.get_element(element_id)
         if element is None:
             return False
-            
-        if hasattr(element, 'set_text'):
+
+        cap = self._text_caps.get(element_id, 0)
+        if cap & 1:
             element.set_text(text)
             return True
-        elif isinstance(element, pygame_gui.elements.UITextBox):
+        if cap == 2:
             element.html_text = text
             element.rebuild()
             return True
-            
+
         return False
         
     def get_element_text(self, element_id: str) -> Optional[str]:
@@ -384,12 +455,13 @@ class UISystem:
         element = self.get_element(element_id)
         if element is None:
             return None
-            
-        if hasattr(element, 'get_text'):
+
+        cap = self._text_caps.get(element_id, 0)
+        if cap & 4:
             return element.get_text()
-        elif isinstance(element, pygame_gui.elements.UITextBox):
+        if cap == 2:
             return element.html_text
-            
+
         return None
         
     def remove_element(self, element_id: str) -> bool:
@@ -408,13 +480,28 @@ class UISystem:
             
         element.kill()
         self.elements.pop(element_id)
-        
-        # 从所有组中移除
-        for group in self.groups.values():
-            if element_id in group:
-                group.pop(element_id)
-                
+        self._element_to_id.pop(id(element), None)
+        self._text_caps.pop(element_id, None)
+
+        # 只从实际所属的组中移除
+        for group_id in self._element_groups.pop(element_id, ()):
+            group = self.groups.get(group_id)
+            if group is not None:
+                group.pop(element_id, None)
+            elements_list = self._group_elements_list.get(group_id)
+            if elements_list is not None and element in elements_list:
+                elements_list.remove(element)
+
         return True
+
+    def _remove_element_only(self, element_id: str) -> None:
+        """移除单个元素但不做组清理，供remove_group批量删除使用"""
+        element = self.elements.pop(element_id, None)
+        if element is None:
+            return
+        element.kill()
+        self._element_to_id.pop(id(element), None)
+        self._text_caps.pop(element_id, None)
         
     def create_group(self, group_id: str, elements: Dict[str, Dict[str, Any]]) -> Dict[str, pygame_gui.core.UIElement]:
         """
@@ -428,16 +515,19 @@ class UISystem:
             创建的UI元素字典
         """
         self.groups[group_id] = {}
-        
+        self._group_elements_list[group_id] = []
+        self._group_visible[group_id] = True
+
         for element_id, element_def in elements.items():
-            element_type = element_def.pop('type')
-            rect = element_def.pop('rect')
-            element_def['group'] = group_id
-            
-            element = self.create_element(element_type, element_id, rect, **element_def)
+            # 不pop调用方的定义字典：从JSON加载的配置应保持不变，
+            # 同一份定义可以重复用来建组
+            kwargs = {k: v for k, v in element_def.items() if k not in ('type', 'rect')}
+            kwargs['group'] = group_id
+
+            element = self.create_element(element_def['type'], element_id, element_def['rect'], **kwargs)
             if element:
                 self.groups[group_id][element_id] = element
-                
+
         return self.groups[group_id]
         
     def hide_group(self, group_id: str) -> bool:
@@ -452,10 +542,16 @@ class UISystem:
         """
         if group_id not in self.groups:
             return False
-            
-        for element in self.groups[group_id].values():
-            element.hide()
-            
+
+        # 已处于隐藏状态时直接返回，避免重复触发pygame_gui的重建
+        if not self._group_visible.get(group_id, True):
+            return True
+
+        for element in self._group_elements_list.get(group_id, ()):
+            if getattr(element, 'visible', True):
+                element.hide()
+
+        self._group_visible[group_id] = False
         return True
         
     def show_group(self, group_id: str) -> bool:
@@ -470,10 +566,15 @@ class UISystem:
         """
         if group_id not in self.groups:
             return False
-            
-        for element in self.groups[group_id].values():
-            element.show()
-            
+
+        if self._group_visible.get(group_id, True):
+            return True
+
+        for element in self._group_elements_list.get(group_id, ()):
+            if not getattr(element, 'visible', True):
+                element.show()
+
+        self._group_visible[group_id] = True
         return True
         
     def remove_group(self, group_id: str) -> bool:
@@ -486,31 +587,47 @@ class UISystem:
         Returns:
             是否成功
         """
-        if group_id not in self.groups:
+        group = self.groups.pop(group_id, None)
+        if group is None:
             return False
-            
-        for element_id in list(self.groups[group_id].keys()):
-            self.remove_element(element_id)
-            
-        self.groups.pop(group_id)
+
+        # 批量删除：逐元素kill后一次性修正反向表，不走remove_element的
+        # 每元素组清理（那会对每个元素再探测一遍组）
+        for element_id, element in list(group.items()):
+            self._remove_element_only(element_id)
+            memberships = self._element_groups.get(element_id)
+            if memberships is not None:
+                memberships.discard(group_id)
+                if memberships:
+                    # 元素还在其它组里，从那些组中也摘除
+                    for other_id in memberships:
+                        other = self.groups.get(other_id)
+                        if other is not None:
+                            other.pop(element_id, None)
+                        other_list = self._group_elements_list.get(other_id)
+                        if other_list is not None and element in other_list:
+                            other_list.remove(element)
+                self._element_groups.pop(element_id, None)
+
+        self._group_elements_list.pop(group_id, None)
+        self._group_visible.pop(group_id, None)
         return True
         
     # 以下是一些常用的UI创建函数
-    def create_hr(self, rect: pygame.Rect, **kwargs) -> Optional[HorizontalLayout]:
+    def create_hr(self, element_id: str, rect: pygame.Rect, **kwargs) -> Optional[HorizontalLayout]:
         """
         创建水平布局
-        
+
         Args:
+            element_id: 元素ID
             rect: 矩形区域
             **kwargs: 其他参数
-            
+
         Returns:
             水平布局
         """
-        parent = UISystem._parent_stack[-1] if UISystem._parent_stack else None
-        layout = HorizontalLayout(parent)
-        container = pygame_gui.core.UIContainer()
-        return layout
+        container = _PARENT_STACK[-1] if _PARENT_STACK else None
+        return self.create_element('horizontal_layout', element_id, rect, container, **kwargs)
     
     def create_button(self, element_id: str, text: str, rect: pygame.Rect, 
                      container: Optional[pygame_gui.core.UIContainer] = None,
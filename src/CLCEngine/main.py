@@ -51,7 +51,7 @@ class CLCEngine:
         
         # 设置屏幕
         self.screen_size = screen_size
-        self.screen = pygame.display.set_mode(screen_size, pygame.RESIZABLE)
+        self.screen = self._create_display(screen_size)
         pygame.display.set_caption(title)
         
         # 初始化时间系统
@@ -74,6 +74,11 @@ class CLCEngine:
         self.scenes: Dict[str, Scene] = {}
         self.active_scene: Optional[Scene] = None
         
+        # 帧率控制时钟与清屏色：主循环每帧使用，只建一次。
+        # 每帧新建Clock会让tick()失去上一帧的时间基准，限帧完全失效
+        self._clock = pygame.time.Clock()
+        self._black = (0, 0, 0)
+
         # 引擎状态
         self.is_running = False
         self.is_editor_mode = is_editor_mode
@@ -83,6 +88,9 @@ class CLCEngine:
         else:
             self.is_paused = False
         
+        # 编辑器按钮点击的路由回调，重注册时先退订旧的
+        self._editor_button_router = None
+
         # 引擎事件
         self.on_quit = Event[EventArgs]("engine:quit")
         self.on_toggle_editor = Event[ToggleEditorEventArgs]("engine:toggle_editor")
@@ -91,6 +99,17 @@ class CLCEngine:
         # 注册默认事件
         self._register_default_events()
         
+    # 双缓冲呈现；显式32位深让convert()基本退化成拷贝。
+    # SCALED固定逻辑分辨率，与引擎自己的resize重排布冲突，不启用
+    _DISPLAY_FLAGS = pygame.RESIZABLE | pygame.DOUBLEBUF
+
+    def _create_display(self, size: Tuple[int, int]) -> pygame.Surface:
+        """创建显示surface，优先让SDL自己做垂直同步，不支持时回退"""
+        try:
+            return pygame.display.set_mode(size, self._DISPLAY_FLAGS, 32, vsync=1)
+        except pygame.error:
+            return pygame.display.set_mode(size, self._DISPLAY_FLAGS, 32)
+
     def _register_default_events(self):
         """注册默认事件处理器"""
         # 退出事件
@@ -98,20 +117,17 @@ class CLCEngine:
             self.is_running = False
         self.on_quit += on_quit
         
-        # 切换编辑器模式事件
+        # 切换编辑器模式事件。约定触发方必须携带具体的
+        # ToggleEditorEventArgs，"取反"语义由调用方在构造参数时表达
+        # （如ToggleEditorEventArgs(not engine.is_editor_mode)），
+        # 处理器里不再做isinstance分派
         def on_toggle_editor(sender, args):
-            if isinstance(args, ToggleEditorEventArgs):
-                self.set_editor_mode(args.is_editor_mode)
-            else:
-                self.set_editor_mode(not self.is_editor_mode)
+            self.set_editor_mode(args.is_editor_mode)
         self.on_toggle_editor += on_toggle_editor
-        
-        # 暂停事件
+
+        # 暂停事件，同样要求携带TogglePauseEventArgs
         def on_toggle_pause(sender, args):
-            if isinstance(args, TogglePauseEventArgs):
-                self.is_paused = args.is_paused
-            else:
-                self.is_paused = not self.is_paused
+            self.is_paused = args.is_paused
         self.on_toggle_pause += on_toggle_pause
         
     def create_scene(self, name: str) -> Scene:
@@ -166,83 +182,66 @@ class CLCEngine:
         def on_play(sender, args):
             toggle_args = ToggleEditorEventArgs(False)
             self.on_toggle_editor.invoke(self, toggle_args)
-        
-        play_button = self.ui_system.get_element("play_button")
-        if play_button:
-            button_event = self.ui_system.get_event("button_clicked")
-            if button_event:
-                button_event += on_play
-            
+
         # 暂停按钮
         def on_pause(sender, args):
             toggle_args = TogglePauseEventArgs(not self.is_paused)
             self.on_toggle_pause.invoke(self, toggle_args)
-        
-        pause_button = self.ui_system.get_element("pause_button")
-        if pause_button:
-            button_event = self.ui_system.get_event("button_clicked")
-            if button_event:
-                button_event += on_pause
-        
+
         # 停止按钮
         def on_stop(sender, args):
             if not self.is_editor_mode:
                 toggle_args = ToggleEditorEventArgs(True)
                 self.on_toggle_editor.invoke(self, toggle_args)
             self.is_paused = False
-        
-        stop_button = self.ui_system.get_element("stop_button")
-        if stop_button:
-            button_event = self.ui_system.get_event("button_clicked")
-            if button_event:
-                button_event += on_stop
-        
+
         # 保存按钮
         def on_save(sender, args):
             if self.active_scene:
                 # TODO: 实现保存对话框
                 self.active_scene.save(f"{self.active_scene.name}.json")
-        
-        save_button = self.ui_system.get_element("save_button")
-        if save_button:
-            button_event = self.ui_system.get_event("button_clicked")
-            if button_event:
-                button_event += on_save
-        
+
         # 加载按钮
         def on_load(sender, args):
             # TODO: 实现加载对话框
             pass
-        
-        load_button = self.ui_system.get_element("load_button")
-        if load_button:
-            button_event = self.ui_system.get_event("button_clicked")
-            if button_event:
-                button_event += on_load
-        
+
         # 创建对象按钮
         def on_create_object(sender, args):
             if self.active_scene:
                 obj = self.active_scene.create_gameobject("New Object")
                 # TODO: 刷新层级UI
-        
-        create_object_button = self.ui_system.get_element("create_object_button")
-        if create_object_button:
-            button_event = self.ui_system.get_event("button_clicked")
-            if button_event:
-                button_event += on_create_object
-        
+
         # 删除对象按钮
         def on_delete_object(sender, args):
             # TODO: 实现选中对象的删除
             pass
-        
-        delete_object_button = self.ui_system.get_element("delete_object_button")
-        if delete_object_button:
-            button_event = self.ui_system.get_event("button_clicked")
-            if button_event:
-                button_event += on_delete_object
-        
+
+        # 按钮ID -> 处理函数的路由表。所有按钮共用button_clicked事件，
+        # 只注册一个路由回调，按事件参数里的ui_id分发
+        handlers = {
+            "play_button": on_play,
+            "pause_button": on_pause,
+            "stop_button": on_stop,
+            "save_button": on_save,
+            "load_button": on_load,
+            "create_object_button": on_create_object,
+            "delete_object_button": on_delete_object,
+        }
+
+        def route_button_click(sender, args, _handlers=handlers):
+            handler = _handlers.get(args.ui_id)
+            if handler is not None:
+                handler(sender, args)
+
+        # 每次刷新编辑器UI都会走到这里，先退订上一次的路由回调，
+        # 否则每次VIDEORESIZE都会多挂一份监听
+        button_event = self.ui_system.on_button_clicked
+        if self._editor_button_router is not None:
+            button_event -= self._editor_button_router
+        self._editor_button_router = route_button_click
+        button_event += route_button_click
+
     def run(self):
         """运行游戏引擎主循环"""
         self.is_running = True
@@ -257,66 +256,83 @@ class CLCEngine:
         # 初始化场景
         self.active_scene.start()
         
-        # 主循环
-        accumulated_time = 0
+        # 主循环。稳定对象绑定到局部名，省去每帧的属性查找；
+        # screen和active_scene可能在循环中被替换，仍按帧读取
         fixed_delta_time = self.time_system.get_fixed_delta_time()
-        events_list = []
+        time_system = self.time_system
+        input_system = self.input_system
+        ui_system = self.ui_system
+        process_ui_event = ui_system.process_events
+        update_display = pygame.display.update
+        clock_tick = self._clock.tick
+        clear_color = self._black
+        pending_resize = None
+        last_resize_time = 0.0
         while self.is_running:
+            # 先采集输入再推进时间和逻辑，避免输入多出一帧延迟
+            events_list = input_system.poll_and_tick()
+
             # 更新时间系统
-            self.time_system.update()
-            delta_time = self.time_system.get_delta_time()
-            
-            events_list = pygame.event.get()
-            # 处理输入
-            self.input_system.update(events_list)
-            
+            time_system.update()
+            delta_time = time_system.get_delta_time()
+
             # 检查退出事件
             for event in events_list:
                 if event.type == pygame.QUIT:
                     self.on_quit.invoke(self, None)
                 elif event.type == pygame.VIDEORESIZE:
+                    # 拖拽窗口边缘时每秒触发大量resize事件，只记录最新尺寸，
+                    # 等静默期过后统一应用（去抖）
+                    pending_resize = (event.w, event.h)
+                    last_resize_time = time_system.current_time
 
-                    self.screen_size = (event.w, event.h)
-                    self.screen = pygame.display.set_mode(self.screen_size, pygame.RESIZABLE)
-                    self.ui_system.initialize(self.screen_size)
-                    if self.is_editor_mode:
-                        self._refresh_editor_ui()
-                
                 # 处理UI事件
-                self.ui_system.process_events(event)
-            
+                process_ui_event(event)
+
+            # 去抖的resize收尾：100ms内没有新的resize事件才真正应用
+            if pending_resize is not None and \
+                    time_system.current_time - last_resize_time > 0.1:
+                self.screen_size = pending_resize
+                self.screen = self._create_display(self.screen_size)
+                ui_system.set_window_resolution(self.screen_size)
+                if self.is_editor_mode:
+                    self._refresh_editor_ui()
+                pending_resize = None
+
             # 游戏逻辑更新（非暂停状态）
             if not self.is_paused or self.is_editor_mode:
                 # 更新场景
                 if self.active_scene:
                     self.active_scene.update(delta_time)
-                    
-                    # 固定时间步长更新（物理等）
-                    accumulated_time += delta_time
-                    while accumulated_time >= fixed_delta_time:
+
+                    # 固定时间步长更新（物理等）。本帧应执行的步数已在
+                    # time_system.update()里整除结算好，这里只消费
+                    while time_system.should_run_fixed_update():
                         self.active_scene.fixed_update(fixed_delta_time)
-                        accumulated_time -= fixed_delta_time
-                
+
                 # 更新UI系统
-                self.ui_system.update(delta_time)
-            
-            # 渲染
-            self.screen.fill((0, 0, 0))  # 清屏
-            
-            # 渲染场景
+                ui_system.update(delta_time)
+
+            # 渲染：收集场景和UI上报的脏矩形，只提交这些区域。
+            # 场景自带背景清屏，没有场景时才由主循环清一次
+            screen = self.screen
             if self.active_scene:
-                self.active_scene.render(self.screen)
-                
+                dirty = self.active_scene.render(screen)
+            else:
+                screen.fill(clear_color)  # 清屏
+                dirty = [screen.get_rect()]
+
             # 渲染UI
-            self.ui_system.draw(self.screen)
-            
-            # 更新显示
-            pygame.display.flip()
-            
+            dirty += ui_system.draw(screen)
+
+            # 更新显示：只提交脏区域；整帧无变化时跳过提交
+            if dirty:
+                update_display(dirty)
+
             # 帧率控制
-            if self.time_system.vsync_enabled:
-                pygame.time.Clock().tick(self.time_system.target_fps)
-                
+            if time_system.vsync_enabled:
+                clock_tick(time_system.target_fps)
+
         # 清理资源
         pygame.quit()
 
@@ -352,9 +368,10 @@ def main():
     if args.assets:
         engine.asset_system.add_user_asset_root(args.assets)
         
-    # 加载资源清单（如果指定）
+    # 加载资源清单（如果指定），并在进入主循环前并行预加载清单资源
     if args.manifest:
         engine.asset_system.load_manifest(args.manifest)
+        engine.asset_system.finalize_preload(engine.asset_system.preload())
     
     # 设置模式
     engine.set_editor_mode(args.editor)
@@ -1,10 +1,71 @@
+import io
+import mmap
 import os
 import json
+import pickle
 import pygame
+
+try:
+    import orjson
+except ImportError:
+    # orjson为可选依赖，未安装时退回标准库json
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple, Union, Set
-import pathlib
 from core.systems.event_system import Event, EventArgs
 
+
+# 带alpha通道的图像格式。其余格式走convert()，24bpp比32bpp省四分之一
+# 的blit带宽，转换本身也更快
+_ALPHA_EXTS = frozenset(('.png', '.gif'))
+
+
+def _convert_surface(surface: pygame.Surface, asset_path: str) -> pygame.Surface:
+    """按源文件格式选择像素转换：PNG/GIF保留alpha，JPG/BMP等转24bpp"""
+    dot = asset_path.rfind('.')
+    if dot >= 0 and asset_path[dot:].lower() in _ALPHA_EXTS:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+@lru_cache(maxsize=4096)
+def _resolve_asset_path(asset_path: str, roots: Tuple[str, ...]) -> Optional[str]:
+    """
+    在给定的根目录元组中解析资源完整路径（带缓存）。
+    大清单会对重叠的路径反复解析，缓存后重复查询是一次字典命中；
+    roots作为参数传入保证根目录变化后键不同，不会拿到过期结果。
+    """
+    # 如果是绝对路径且存在，直接返回
+    if os.path.isabs(asset_path) and os.path.exists(asset_path):
+        return asset_path
+
+    # 统一分隔符，处理跨平台问题（纯字符串操作，不走pathlib）
+    posix_path = asset_path.replace('\\', '/')
+    # 在所有资源根目录中查找
+    for root in roots:
+        full_path = os.path.join(root, posix_path)
+        if os.path.exists(full_path):
+            return full_path
+
+    return None
+
+
+def _read_buffered(path: str) -> io.BytesIO:
+    """
+    把整个文件经mmap映射后一次性取出，返回BytesIO视图。
+    pygame的图像/字体解码器直接拿文件对象会做大量小read()系统调用，
+    冷缓存下大资源明显受I/O拖累；整块读入后解码完全在内存中进行。
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # 空文件等映射不了的情况退回普通整读
+            return io.BytesIO(f.read())
+        with mm:
+            return io.BytesIO(mm.read())
+
 class AssetLoadedEventArgs(EventArgs):
     """资源加载事件参数"""
     def __init__(self, asset_id: str, asset_type: str, asset: Any):
@@ -34,9 +95,24 @@ class AssetAddressSystem:
         
         # 已加载的资源，key: asset_id, value: asset
         self._loaded_assets: Dict[str, Any] = {}
+
+        # 字体文件原始字节缓存，key: asset_id。同一字体不同字号重复
+        # 构造Font时不再碰磁盘
+        self._font_bytes: Dict[str, bytes] = {}
+
+        # 构造好的字体对象缓存，key: (asset_id, font_size)。
+        # TTF解析开销大，同字号重复取直接查表返回
+        self._font_cache: Dict[Tuple[str, int], pygame.font.Font] = {}
+
+        # 缩放结果缓存，key: (asset_id, size)。UI重绘经常反复要同一尺寸
+        self._resized_cache: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
         
-        # 用户资源根目录
+        # 用户资源根目录。list保证查找时的优先级顺序（先加的先命中），
+        # set做O(1)去重判断，根目录多的清单不再线性扫描
         self._user_asset_roots: List[str] = []
+        self._user_asset_roots_set: Set[str] = set()
+        # 根目录的不可变快照，作为路径解析缓存的键的一部分
+        self._roots_tuple: Tuple[str, ...] = ()
         
         # 资源类型
         self.ASSET_TYPE_IMAGE = "image"
@@ -67,6 +143,10 @@ class AssetAddressSystem:
         
         # 事件
         self.on_asset_loaded = Event[AssetLoadedEventArgs]("asset_loaded")
+
+        # 预加载用的I/O线程池。文件读取和PNG解码会释放GIL，
+        # 多个资源的加载可以真正并行；线程在首次submit时才创建
+        self._io_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
         
     def add_user_asset_root(self, path: str) -> bool:
         """
@@ -82,11 +162,15 @@ class AssetAddressSystem:
             return False
             
         absolute_path = os.path.abspath(path)
-        if absolute_path not in self._user_asset_roots:
-            self._user_asset_roots.append(absolute_path)
-            return True
-            
-        return False
+        if absolute_path in self._user_asset_roots_set:
+            return False
+
+        self._user_asset_roots.append(absolute_path)
+        self._user_asset_roots_set.add(absolute_path)
+        self._roots_tuple = tuple(self._user_asset_roots)
+        # 根目录集合变了，此前解析失败的路径可能变得可解析
+        _resolve_asset_path.cache_clear()
+        return True
         
     def remove_user_asset_root(self, path: str) -> bool:
         """
@@ -99,10 +183,13 @@ class AssetAddressSystem:
             是否成功移除
         """
         absolute_path = os.path.abspath(path)
-        if absolute_path in self._user_asset_roots:
+        if absolute_path in self._user_asset_roots_set:
             self._user_asset_roots.remove(absolute_path)
+            self._user_asset_roots_set.discard(absolute_path)
+            self._roots_tuple = tuple(self._user_asset_roots)
+            _resolve_asset_path.cache_clear()
             return True
-            
+
         return False
         
     def register_asset(self, asset_id: str, asset_path: str, asset_type: Optional[str] = None) -> bool:
@@ -122,10 +209,14 @@ class AssetAddressSystem:
         if not full_path:
             return False
             
-        # 如果没有指定资源类型，根据扩展名判断
+        # 如果没有指定资源类型，根据扩展名判断。
+        # 用rfind在文件名上直接切扩展名，不走splitext的纯Python实现
         if asset_type is None:
-            ext = os.path.splitext(asset_path)[1].lower()
-            asset_type = self._ext_to_type.get(ext)
+            name = os.path.basename(asset_path)
+            dot = name.rfind('.')
+            if dot <= 0:
+                return False
+            asset_type = self._ext_to_type.get(name[dot:].lower())
             if asset_type is None:
                 return False
                 
@@ -147,6 +238,11 @@ class AssetAddressSystem:
             del self._asset_paths[asset_id]
             if asset_id in self._loaded_assets:
                 del self._loaded_assets[asset_id]
+            self._font_bytes.pop(asset_id, None)
+            for key in [k for k in self._font_cache if k[0] == asset_id]:
+                del self._font_cache[key]
+            for key in [k for k in self._resized_cache if k[0] == asset_id]:
+                del self._resized_cache[key]
             return True
             
         return False
@@ -162,30 +258,39 @@ class AssetAddressSystem:
         Returns:
             加载的资源，加载失败返回None
         """
+        # 热路径：属性绑定到局部名，命中缓存时只有一次LOAD_ATTR
+        loaded = self._loaded_assets
+
         # 检查资源是否已加载
-        if not force_reload and asset_id in self._loaded_assets:
-            return self._loaded_assets[asset_id]
-            
+        if not force_reload:
+            asset = loaded.get(asset_id)
+            if asset is not None:
+                return asset
+
         # 检查资源是否已注册
-        if asset_id not in self._asset_paths:
+        entry = self._asset_paths.get(asset_id)
+        if entry is None:
             return None
-            
-        asset_type, asset_path = self._asset_paths[asset_id]
+
+        asset_type, asset_path = entry
         asset = None
         
         try:
-            # 根据资源类型加载
+            # 根据资源类型加载。二进制资源先整块读入内存再交给解码器，
+            # 文件名仅用于pygame的格式探测
             if asset_type == self.ASSET_TYPE_IMAGE:
-                asset = pygame.image.load(asset_path).convert_alpha()
+                asset = _convert_surface(
+                    pygame.image.load(_read_buffered(asset_path), asset_path), asset_path)
             elif asset_type == self.ASSET_TYPE_SOUND:
-                asset = pygame.mixer.Sound(asset_path)
+                asset = pygame.mixer.Sound(file=_read_buffered(asset_path))
             elif asset_type == self.ASSET_TYPE_FONT:
                 # 假设font_size已经被设置或传入
                 font_size = 24  # 默认大小
-                asset = pygame.font.Font(asset_path, font_size)
+                asset = pygame.font.Font(self._get_font_bytes(asset_id, asset_path), font_size)
             elif asset_type == self.ASSET_TYPE_JSON:
-                with open(asset_path, 'r', encoding='utf-8') as f:
-                    asset = json.load(f)
+                with open(asset_path, 'rb') as f:
+                    raw = f.read()
+                asset = orjson.loads(raw) if orjson is not None else json.loads(raw)
             elif asset_type == self.ASSET_TYPE_TEXT:
                 with open(asset_path, 'r', encoding='utf-8') as f:
                     asset = f.read()
@@ -195,13 +300,97 @@ class AssetAddressSystem:
             
         # 存储已加载的资源
         if asset is not None:
-            self._loaded_assets[asset_id] = asset
-            # 触发事件
-            args = AssetLoadedEventArgs(asset_id, asset_type, asset)
-            self.on_asset_loaded.invoke(self, args)
+            loaded[asset_id] = asset
+            # 触发事件；没有订阅者时连参数对象都不分配，
+            # 批量预载且无人监听的场景下省掉N次小对象分配
+            if self.on_asset_loaded.has_subscribers():
+                args = AssetLoadedEventArgs(asset_id, asset_type, asset)
+                self.on_asset_loaded.invoke(self, args)
             
         return asset
         
+    def _get_font_bytes(self, asset_id: str, asset_path: str) -> io.BytesIO:
+        """取字体文件字节（带缓存），返回可供pygame.font.Font使用的BytesIO"""
+        raw = self._font_bytes.get(asset_id)
+        if raw is None:
+            raw = _read_buffered(asset_path).getvalue()
+            self._font_bytes[asset_id] = raw
+        return io.BytesIO(raw)
+
+    def _load_asset_raw(self, asset_id: str) -> Optional[Tuple[str, str, Any]]:
+        """
+        工作线程版加载：读盘+解码，但不做convert_alpha（必须在主线程），
+        也不触发事件。返回(asset_id, asset_type, asset)，失败返回None。
+        """
+        if asset_id in self._loaded_assets or asset_id not in self._asset_paths:
+            return None
+
+        asset_type, asset_path = self._asset_paths[asset_id]
+        asset = None
+
+        try:
+            if asset_type == self.ASSET_TYPE_IMAGE:
+                asset = pygame.image.load(_read_buffered(asset_path), asset_path)
+            elif asset_type == self.ASSET_TYPE_SOUND:
+                asset = pygame.mixer.Sound(file=_read_buffered(asset_path))
+            elif asset_type == self.ASSET_TYPE_FONT:
+                asset = pygame.font.Font(self._get_font_bytes(asset_id, asset_path), 24)
+            elif asset_type == self.ASSET_TYPE_JSON:
+                with open(asset_path, 'rb') as f:
+                    raw = f.read()
+                asset = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            elif asset_type == self.ASSET_TYPE_TEXT:
+                with open(asset_path, 'r', encoding='utf-8') as f:
+                    asset = f.read()
+        except Exception as e:
+            print(f"预加载资源失败 {asset_id}: {e}")
+            return None
+
+        if asset is None:
+            return None
+        return (asset_id, asset_type, asset)
+
+    def preload(self, asset_ids: Optional[List[str]] = None) -> List[Future]:
+        """
+        把一批资源的加载提交到I/O线程池，返回future列表。
+        加载与解码在后台并行进行，主线程随后调用finalize_preload收尾。
+
+        Args:
+            asset_ids: 要预加载的资源ID列表，为None则预加载所有已注册资源
+
+        Returns:
+            future列表，供finalize_preload消费
+        """
+        ids = asset_ids if asset_ids is not None else list(self._asset_paths)
+        return [self._io_pool.submit(self._load_asset_raw, asset_id)
+                for asset_id in ids if asset_id not in self._loaded_assets]
+
+    def finalize_preload(self, futures: List[Future]) -> int:
+        """
+        在主线程收尾预加载：等待所有future，对图像补做convert_alpha
+        （像素格式转换必须在持有显示surface的线程进行），入缓存并触发事件。
+
+        Args:
+            futures: preload返回的future列表
+
+        Returns:
+            成功加载的资源数量
+        """
+        loaded = 0
+        notify = self.on_asset_loaded.has_subscribers()
+        for future in futures:
+            result = future.result()
+            if result is None:
+                continue
+            asset_id, asset_type, asset = result
+            if asset_type == self.ASSET_TYPE_IMAGE:
+                asset = _convert_surface(asset, self._asset_paths[asset_id][1])
+            self._loaded_assets[asset_id] = asset
+            if notify:
+                self.on_asset_loaded.invoke(self, AssetLoadedEventArgs(asset_id, asset_type, asset))
+            loaded += 1
+        return loaded
+
     def load_font(self, asset_id: str, font_size: int) -> Optional[pygame.font.Font]:
         """
         加载字体
@@ -213,16 +402,23 @@ class AssetAddressSystem:
         Returns:
             加载的字体，加载失败返回None
         """
+        # 同字体同字号直接命中缓存，不重复解析TTF
+        cache_key = (asset_id, font_size)
+        font = self._font_cache.get(cache_key)
+        if font is not None:
+            return font
+
         # 检查资源是否已注册
         if asset_id not in self._asset_paths:
             return None
-            
+
         asset_type, asset_path = self._asset_paths[asset_id]
         if asset_type != self.ASSET_TYPE_FONT:
             return None
-            
+
         try:
-            font = pygame.font.Font(asset_path, font_size)
+            font = pygame.font.Font(self._get_font_bytes(asset_id, asset_path), font_size)
+            self._font_cache[cache_key] = font
             return font
         except Exception as e:
             print(f"加载字体失败 {asset_id}: {e}")
@@ -257,6 +453,9 @@ class AssetAddressSystem:
         清除所有已加载的资源
         """
         self._loaded_assets.clear()
+        self._font_bytes.clear()
+        self._font_cache.clear()
+        self._resized_cache.clear()
         
     def scan_directory(self, directory: str, recursive: bool = True) -> Dict[str, Tuple[str, str]]:
         """
@@ -270,31 +469,45 @@ class AssetAddressSystem:
             注册的资源字典，key: asset_id, value: (asset_type, path)
         """
         registered_assets = {}
-        
+
         full_path = self._find_asset_path(directory)
         if not full_path or not os.path.isdir(full_path):
             return registered_assets
-            
-        for path, dirs, files in os.walk(full_path):
-            if not recursive and path != full_path:
-                continue
-                
-            for file in files:
-                file_path = os.path.join(path, file)
-                file_ext = os.path.splitext(file)[1].lower()
-                
-                if file_ext not in self._ext_to_type:
-                    continue
-                    
-                # 生成资源ID，相对于根目录的路径
-                rel_path = os.path.relpath(file_path, full_path)
-                asset_id = rel_path.replace('\\', '/')
-                
-                # 注册资源
-                asset_type = self._ext_to_type[file_ext]
-                self._asset_paths[asset_id] = (asset_type, file_path)
-                registered_assets[asset_id] = (asset_type, file_path)
-                
+
+        # 用scandir手动遍历：DirEntry自带缓存的is_file/is_dir结果，
+        # 比os.walk少一次per-entry的stat；扩展名用rfind切出来，
+        # 不走splitext的路径规范化
+        ext_to_type = self._ext_to_type
+        asset_paths = self._asset_paths
+        relpath = os.path.relpath
+        stack = [full_path]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot < 0:
+                        continue
+                    asset_type = ext_to_type.get(name[dot:].lower())
+                    if asset_type is None:
+                        continue
+
+                    # 生成资源ID，相对于根目录的路径
+                    file_path = entry.path
+                    asset_id = relpath(file_path, full_path).replace('\\', '/')
+
+                    # 注册资源
+                    asset_paths[asset_id] = (asset_type, file_path)
+                    registered_assets[asset_id] = (asset_type, file_path)
+
         return registered_assets
         
     def load_manifest(self, manifest_path: str) -> bool:
@@ -312,9 +525,12 @@ class AssetAddressSystem:
             return False
             
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-                
+            # 一次性读入整个文件再解析，不让解码器小块小块地从文件对象取数据
+            with open(full_path, 'rb') as f:
+                raw = f.read()
+            manifest = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
             if not isinstance(manifest, dict):
                 return False
                 
@@ -368,14 +584,68 @@ class AssetAddressSystem:
                     "type": asset_type
                 })
                 
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=4)
-                
+            # 先在内存里序列化完，再一次write落盘；json.dump会对文件对象
+            # 做大量零碎write，大清单时系统调用开销明显
+            if orjson is not None:
+                data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(manifest, indent=4).encode('utf-8')
+            with open(manifest_path, 'wb') as f:
+                f.write(data)
+
             return True
         except Exception as e:
             print(f"保存资源清单失败: {e}")
             return False
             
+    def save_manifest_binary(self, manifest_path: str) -> bool:
+        """
+        保存二进制格式的资源清单。
+        清单是纯字符串和元组的结构，pickle反序列化远快于JSON文本解析，
+        适合引擎打包的资源（千条以上冷启动收益最明显）。
+        不可信来源的清单仍应走JSON路径，pickle不做任何安全校验。
+
+        Args:
+            manifest_path: 清单文件路径
+
+        Returns:
+            是否成功保存
+        """
+        try:
+            data = pickle.dumps((self._user_asset_roots, self._asset_paths),
+                                protocol=pickle.HIGHEST_PROTOCOL)
+            with open(manifest_path, 'wb') as f:
+                f.write(data)
+            return True
+        except Exception as e:
+            print(f"保存二进制资源清单失败: {e}")
+            return False
+
+    def load_manifest_binary(self, manifest_path: str) -> bool:
+        """
+        加载二进制格式的资源清单（save_manifest_binary的逆操作）。
+        只用于引擎自己生成的可信清单。
+
+        Args:
+            manifest_path: 清单文件路径
+
+        Returns:
+            是否成功加载
+        """
+        full_path = self._find_asset_path(manifest_path)
+        if not full_path:
+            return False
+
+        try:
+            roots, asset_paths = pickle.loads(_read_buffered(full_path).getbuffer())
+            for root in roots:
+                self.add_user_asset_root(root)
+            self._asset_paths.update(asset_paths)
+            return True
+        except Exception as e:
+            print(f"加载二进制资源清单失败: {e}")
+            return False
+
     def _find_asset_path(self, asset_path: str) -> Optional[str]:
         """
         查找资源的完整路径
@@ -386,19 +656,7 @@ class AssetAddressSystem:
         Returns:
             完整路径，未找到返回None
         """
-        # 如果是绝对路径且存在，直接返回
-        if os.path.isabs(asset_path) and os.path.exists(asset_path):
-            return asset_path
-            
-        # 解析路径，处理跨平台问题
-        path_obj = pathlib.Path(asset_path)
-        # 在所有资源根目录中查找
-        for root in self._user_asset_roots:
-            full_path = os.path.join(root, path_obj.as_posix())
-            if os.path.exists(full_path):
-                return full_path
-                
-        return None
+        return _resolve_asset_path(asset_path, self._roots_tuple)
         
     def resize_image(self, asset_id: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
         """
@@ -411,16 +669,37 @@ class AssetAddressSystem:
         Returns:
             调整大小后的图像，失败返回None
         """
+        cache_key = (asset_id, size)
+        resized = self._resized_cache.get(cache_key)
+        if resized is not None:
+            return resized
+
         image = self.get_asset(asset_id)
         if image is None or not isinstance(image, pygame.Surface):
             return None
-            
+
         try:
-            resized = pygame.transform.scale(image, size)
+            # smoothscale走SDL的SIMD路径，非整数倍缩放质量也远好于
+            # 最近邻的transform.scale
+            resized = pygame.transform.smoothscale(image, size)
+            self._resized_cache[cache_key] = resized
             return resized
         except Exception as e:
             print(f"调整图像大小失败 {asset_id}: {e}")
             return None
+
+    def resize_images_bulk(self, items: List[Tuple[str, Tuple[int, int]]]) -> Dict[str, Optional[pygame.Surface]]:
+        """
+        批量调整图像大小（如关卡加载时的整批精灵预处理）。
+        逐项走带缓存的resize_image，重复的(资源, 尺寸)组合只算一次。
+
+        Args:
+            items: (asset_id, size)列表
+
+        Returns:
+            asset_id -> 缩放后图像的字典，失败项为None
+        """
+        return {asset_id: self.resize_image(asset_id, size) for asset_id, size in items}
             
     def get_asset_info(self, asset_id: str) -> Optional[Dict[str, Any]]:
         """